@@ -122,7 +122,13 @@ class GameManager:
         Retrieves a list of tower IDs that the player has unlocked.
         """
         player_data = self.progression_manager.get_player_data()
-        unlocked_set = player_data.unlocked_towers
+        unlocked_towers = player_data.unlocked_towers
+        # Save data stores a list; make sure membership tests below are O(1).
+        unlocked_set = (
+            unlocked_towers
+            if isinstance(unlocked_towers, (set, frozenset))
+            else set(unlocked_towers)
+        )
         all_tower_ids_in_order = self.configs.get("tower_types", {}).keys()
         return [
             tower_id for tower_id in all_tower_ids_in_order if tower_id in unlocked_set
@@ -1,5 +1,6 @@
 # rendering/hud/panel_utils.py
-from typing import Dict, Any
+import pygame
+from typing import Dict, Any, Sequence, Tuple
 
 
 def get_nested_value(data: Any, path: str) -> Any:
@@ -50,3 +51,28 @@ def format_stat_value(value: Any, format_key: str) -> str:
         if isinstance(value, float) and value.is_integer():
             return str(int(value))
         return str(value)
+
+
+def to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """
+    Converts a cached per-pixel-alpha surface to the display's pixel format so
+    the per-frame blit takes the fast path. Without a display mode (e.g. in a
+    headless run) the unconverted surface is returned.
+    """
+    try:
+        return surface.convert_alpha()
+    except pygame.error:
+        return surface
+
+
+def blit_sequence(
+    screen: pygame.Surface, sequence: Sequence[Tuple[pygame.Surface, Any]]
+):
+    """
+    Blits a sequence of (surface, destination) pairs in a single call. Uses
+    pygame-ce's fblits() when available and falls back to blits() otherwise.
+    """
+    if hasattr(screen, "fblits"):
+        screen.fblits(sequence)
+    else:
+        screen.blits(sequence, doreturn=False)
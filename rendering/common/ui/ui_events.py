@@ -0,0 +1,9 @@
+# rendering/common/ui/ui_events.py
+import pygame
+
+# The HUD and the menus only react to the mouse. Events of any other type
+# (keys, timers, window events) are dropped before reaching panels, screens
+# or buttons.
+POSITIONAL_EVENT_TYPES = frozenset(
+    {pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP}
+)
@@ -68,6 +68,9 @@ class Game:
             ui_theme=self.ui_theme,
             font_manager=self.font_manager,
         )
+        # The tooltip shown last frame; the menu's partial updates don't cover
+        # tooltip pixels, so any change to it forces a full menu redraw.
+        self._last_tooltip = None
 
         self.menu_manager = MenuManager(
             screen_rect=self.screen.get_rect(),
@@ -128,6 +131,8 @@ class Game:
         self.sprite_renderer = None
         self.camera = None
         self.input_handler = None
+        # Tooltips requested by the in-game HUD must not carry over.
+        self.tooltip_manager.cancel_tooltip()
 
         self.background_color = self.ui_theme.get("colors", {}).get(
             "background_primary", (15, 20, 25)
@@ -239,6 +244,21 @@ class Game:
 
     def _draw(self):
         """Draws the entire game state to the screen."""
+        active_tooltip = self.tooltip_manager.active_tooltip
+        if active_tooltip is not self._last_tooltip:
+            # A tooltip appeared or went away, so its area must be repainted.
+            self._last_tooltip = active_tooltip
+            self.menu_manager.invalidate()
+
+        if self.game_state == GameState.MAIN_MENU and not active_tooltip:
+            # An idle main menu only repaints (and presents) the buttons whose
+            # hover changed, or nothing at all, instead of a full flip.
+            dirty = self.menu_manager.draw_updates(self.screen, self.background_color)
+            if dirty is not None:
+                if dirty:
+                    pygame.display.update(dirty)
+                return
+
         self.screen.fill(self.background_color)
 
         if self.game_state == GameState.MAIN_MENU:
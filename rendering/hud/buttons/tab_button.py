@@ -1,7 +1,7 @@
 # rendering/hud/buttons/tab_button.py
 import pygame
 import logging
-from typing import Dict, Any, TYPE_CHECKING
+from typing import Dict, Any, Optional, Tuple, TYPE_CHECKING
 
 from rendering.common.ui.ui_element import UIElement
 
@@ -44,6 +44,10 @@ class TabButton(UIElement):
         self.layout = ui_theme.get("layout", {})
         self.font = font_manager.get_font("body_medium")
 
+        # Composed tab surface and the (active, hovered) state it was drawn for.
+        self._surface: Optional[pygame.Surface] = None
+        self._surface_state: Optional[Tuple[bool, bool]] = None
+
     def handle_event(self, event: pygame.event.Event, game_state=None) -> bool:
         """
         Handles mouse clicks on the tab.
@@ -56,8 +60,25 @@ class TabButton(UIElement):
                 return True
         return False
 
+    def render(self) -> Tuple[pygame.Surface, pygame.Rect]:
+        """
+        Returns the tab composed for its current state together with the rect
+        to blit it at. The composed surface is reused until the tab's active
+        or hover state changes.
+        """
+        state = (self.is_active, self.is_hovered)
+        if self._surface is None or state != self._surface_state:
+            self._surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            self._compose(self._surface, self._surface.get_rect())
+            self._surface_state = state
+        return self._surface, self.rect
+
     def draw(self, screen: pygame.Surface):
         """Draws the tab button using theme-defined styles."""
+        screen.blit(*self.render())
+
+    def _compose(self, surface: pygame.Surface, rect: pygame.Rect):
+        """Draws the tab's shape, border and label into rect."""
         # Determine colors based on state
         if self.is_active:
             bg_color = self.colors.get("panel_secondary")
@@ -76,16 +97,16 @@ class TabButton(UIElement):
 
         # Draw the button shape (a rectangle with only top corners rounded)
         pygame.draw.rect(
-            screen,
+            surface,
             bg_color,
-            self.rect,
+            rect,
             border_top_left_radius=border_radius,
             border_top_right_radius=border_radius,
         )
         pygame.draw.rect(
-            screen,
+            surface,
             border_color,
-            self.rect,
+            rect,
             self.layout.get("border_width_standard", 2),
             border_top_left_radius=border_radius,
             border_top_right_radius=border_radius,
@@ -93,5 +114,5 @@ class TabButton(UIElement):
 
         # Render and position the text
         text_surf = self.font.render(self.category_name.capitalize(), True, text_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        screen.blit(text_surf, text_rect)
+        text_rect = text_surf.get_rect(center=rect.center)
+        surface.blit(text_surf, text_rect)
@@ -1,8 +1,9 @@
 # rendering/hud/buttons/tower_button.py
 import pygame
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, TYPE_CHECKING
+from typing import Optional, Dict, Any, Tuple, TYPE_CHECKING
 
 from rendering.common.ui.ui_element import UIElement
 from rendering.common.ui.ui_action import UIAction, ActionType
@@ -14,6 +15,25 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _load_tower_icon(
+    assets_path: str, sprite_key: str, icon_size: Tuple[int, int]
+) -> Optional[pygame.Surface]:
+    """
+    Loads and scales a tower icon once; every TowerButton rebuild afterwards
+    shares the same surface. Returns None if the sprite can't be loaded.
+    """
+    try:
+        sprite_path = Path(assets_path) / "sprites" / sprite_key
+        if not sprite_path.is_file():
+            raise FileNotFoundError(f"Sprite file not found at {sprite_path}")
+        image = pygame.image.load(sprite_path).convert_alpha()
+        return pygame.transform.scale(image, icon_size)
+    except (FileNotFoundError, pygame.error) as e:
+        logger.warning(f"Could not load icon '{sprite_key}' ({e}).")
+        return None
+
+
 class TowerButton(UIElement):
     """
     A UI element representing a clickable button to select a tower for building.
@@ -58,22 +78,21 @@ class TowerButton(UIElement):
 
         self.icon = self._load_icon()
 
+        # Composed button surface and the (selected, hovered, affordable)
+        # state it was drawn for.
+        self._surface: Optional[pygame.Surface] = None
+        self._surface_state: Optional[Tuple[bool, bool, bool]] = None
+
     def _load_icon(self) -> pygame.Surface:
         """Loads the tower's icon or creates a placeholder."""
         sprite_key = self.tower_data.get("sprite_key")
         icon_size = (self.rect.width - 10, self.rect.height - 20)
 
         if sprite_key:
-            try:
-                sprite_path = self.assets_path / "sprites" / sprite_key
-                if not sprite_path.is_file():
-                    raise FileNotFoundError(f"Sprite file not found at {sprite_path}")
-                image = pygame.image.load(sprite_path).convert_alpha()
-                return pygame.transform.scale(image, icon_size)
-            except (FileNotFoundError, pygame.error) as e:
-                logger.warning(
-                    f"Could not load icon for '{self.tower_type_id}' ({e}). Creating placeholder."
-                )
+            icon = _load_tower_icon(str(self.assets_path), sprite_key, icon_size)
+            if icon is not None:
+                return icon
+            logger.warning(f"Creating placeholder icon for '{self.tower_type_id}'.")
 
         placeholder = pygame.Surface(icon_size)
         placeholder.fill(self.tower_data.get("placeholder_color", (128, 128, 128)))
@@ -112,16 +131,51 @@ class TowerButton(UIElement):
         # 2. Smoothly interpolate the current offset towards the target offset.
         # This creates a fluid "ease-out" animation effect.
         delta = self.target_y_offset - self.y_offset
-        self.y_offset += delta * self.animation_speed * dt
+        if abs(delta) < 0.1:
+            # Snap once the remaining distance is imperceptible so the button
+            # settles and the UIManager can stop ticking it.
+            self.y_offset = self.target_y_offset
+        else:
+            self.y_offset += delta * self.animation_speed * dt
 
         # 3. Update the actual drawing rectangle's position.
         # This ensures the animation is visually represented.
         self.rect.y = self.base_rect.y + int(self.y_offset)
 
-    def draw(self, screen: pygame.Surface, game_state: "GameState"):
-        """Draws the button using theme-defined styles."""
+    @property
+    def is_animating(self) -> bool:
+        """True while the button is still easing towards its target offset."""
+        return self.y_offset != self.target_y_offset
+
+    def render(self, game_state: "GameState") -> Tuple[pygame.Surface, pygame.Rect]:
+        """
+        Returns the button composed for its current state together with the
+        rect to blit it at. The composed surface is reused until the hover,
+        selection or affordability state changes.
+        """
         is_selected = game_state.selected_tower_to_build == self.tower_type_id
         can_afford = game_state.gold >= self.cost
+        state = (is_selected, self.is_hovered, can_afford)
+        if self._surface is None or state != self._surface_state:
+            self._surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            self._compose(
+                self._surface, self._surface.get_rect(), is_selected, can_afford
+            )
+            self._surface_state = state
+        return self._surface, self.rect
+
+    def draw(self, screen: pygame.Surface, game_state: "GameState"):
+        """Draws the button using theme-defined styles."""
+        screen.blit(*self.render(game_state))
+
+    def _compose(
+        self,
+        surface: pygame.Surface,
+        rect: pygame.Rect,
+        is_selected: bool,
+        can_afford: bool,
+    ):
+        """Draws the button's background, icon, cost and hotkey into rect."""
         border_radius = self.layout.get("border_radius_small", 5)
 
         if is_selected:
@@ -131,10 +185,10 @@ class TowerButton(UIElement):
         else:
             bg_color = self.colors.get("panel_primary")
 
-        pygame.draw.rect(screen, bg_color, self.rect, border_radius=border_radius)
+        pygame.draw.rect(surface, bg_color, rect, border_radius=border_radius)
 
-        icon_rect = self.icon.get_rect(centerx=self.rect.centerx, y=self.rect.y + 5)
-        screen.blit(self.icon, icon_rect)
+        icon_rect = self.icon.get_rect(centerx=rect.centerx, y=rect.y + 5)
+        surface.blit(self.icon, icon_rect)
 
         cost_color = (
             self.colors.get("text_accent")
@@ -142,10 +196,8 @@ class TowerButton(UIElement):
             else self.colors.get("text_error")
         )
         cost_text = self.font_cost.render(f"{self.cost}G", True, cost_color)
-        text_rect = cost_text.get_rect(
-            centerx=self.rect.centerx, bottom=self.rect.bottom - 5
-        )
-        screen.blit(cost_text, text_rect)
+        text_rect = cost_text.get_rect(centerx=rect.centerx, bottom=rect.bottom - 5)
+        surface.blit(cost_text, text_rect)
 
         if is_selected:
             border_color = self.colors.get("border_interactive_selected")
@@ -158,11 +210,11 @@ class TowerButton(UIElement):
             border_width = self.layout.get("border_width_standard", 2)
 
         pygame.draw.rect(
-            screen, border_color, self.rect, border_width, border_radius=border_radius
+            surface, border_color, rect, border_width, border_radius=border_radius
         )
 
         hotkey_surf = self.font_hotkey.render(
             str(self.hotkey_number), True, self.colors.get("text_secondary")
         )
-        hotkey_rect = hotkey_surf.get_rect(topleft=(self.rect.x + 5, self.rect.y + 5))
-        screen.blit(hotkey_surf, hotkey_rect)
+        hotkey_rect = hotkey_surf.get_rect(topleft=(rect.x + 5, rect.y + 5))
+        surface.blit(hotkey_surf, hotkey_rect)
@@ -162,12 +162,50 @@ class PersonaSelectionPanel(UIElement):
         self.is_scrollable = False
 
         self._perform_layout()
+        self._position_panel()
+        self.is_close_hovered = False
+
+    def reset(
+        self,
+        all_personas: Dict[str, Any],
+        eligible_personas: List[str],
+        active_persona: str,
+    ):
+        """
+        Re-initializes the panel for a new tower so the UIManager can reuse a
+        single instance instead of constructing one every time it opens.
+        """
+        persona_ids = [
+            persona_id
+            for persona_id, persona_data in all_personas.items()
+            if isinstance(persona_data, dict)
+        ]
+        if [button.persona_id for button in self.buttons] == persona_ids:
+            # Same persona set as last time: only the per-tower state differs.
+            for button in self.buttons:
+                button.is_active = button.persona_id == active_persona
+                button.is_eligible = button.persona_id in eligible_personas
+                button.is_hovered = False
+        else:
+            self.buttons.clear()
+            self._create_buttons(all_personas, eligible_personas, active_persona)
+
+        self.animation_progress = 0.0
+        self.scroll_y = 0
+        self.is_close_hovered = False
+
+        # The previous opening animation may have left the rect partially scaled.
+        self.rect.size = (self.final_rect.width, 0)
+        self._perform_layout()
+        self._position_panel()
+
+    def _position_panel(self):
+        """Centers the fully-opened panel on screen and places the close button."""
         self.final_rect = self.rect.copy()
-        self.final_rect.center = screen_rect.center
+        self.final_rect.center = self.screen_rect.center
         self.close_button_rect = pygame.Rect(
             self.final_rect.right - 32, self.final_rect.y + 8, 24, 24
         )
-        self.is_close_hovered = False
 
     def _load_theme_assets(self):
         self.colors = self.ui_theme.get("colors", {})
@@ -255,7 +293,7 @@ class PersonaSelectionPanel(UIElement):
         self, event: pygame.event.Event, game_state: "GameState"
     ) -> Optional[UIAction]:
         if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.is_scrollable and self.rect.collidepoint(pygame.mouse.get_pos()):
+            if self.is_scrollable and self.rect.collidepoint(event.pos):
                 if event.button == 4:
                     self.scroll_y = max(0, self.scroll_y - 35)
                 elif event.button == 5:
@@ -268,7 +306,7 @@ class PersonaSelectionPanel(UIElement):
                         action = button.handle_event(event, game_state)
                         if action:
                             return action
-                if self.rect.collidepoint(pygame.mouse.get_pos()):
+                if self.rect.collidepoint(event.pos):
                     return UIAction(type=ActionType.UI_CLICK)
         return None
 
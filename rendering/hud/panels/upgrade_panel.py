@@ -10,6 +10,7 @@ from rendering.common.panels.panel_utils import format_stat_value
 
 if TYPE_CHECKING:
     from game_logic.entities.tower import Tower
+    from game_logic.upgrades.upgrade import Upgrade
     from game_logic.upgrades.upgrade_manager import UpgradeManager
     from game_logic.game_state import GameState
     from rendering.text.font_manager import FontManager
@@ -62,6 +63,8 @@ class UpgradePanel(UIElement):
         self.tooltip_manager = tooltip_manager
 
         self.upgrade_buttons: List[UpgradeButton] = []
+        # The upgrade path ("path_a"/"path_b") of each entry in upgrade_buttons.
+        self._button_paths: List[str] = []
         self.stat_lines: List[_StatLine] = []
         self.persona_change_button_rect = pygame.Rect(0, 0, 0, 0)
         self.is_persona_button_hovered = False
@@ -97,8 +100,33 @@ class UpgradePanel(UIElement):
         self._perform_layout_and_positioning()
         self.update_hover_states()
 
-    def update_hover_states(self):
-        mouse_pos = pygame.mouse.get_pos()
+    def refresh_upgrade(self, upgrade_id: str):
+        """
+        Refreshes the panel after an upgrade purchase. Only the button on the
+        purchased upgrade's path is recreated; the rest of the panel is just
+        re-flowed for the new stats. Falls back to a full rebuild if the
+        upgrade is not shown.
+        """
+        for index, button in enumerate(self.upgrade_buttons):
+            if button.upgrade.id == upgrade_id:
+                break
+        else:
+            self.rebuild_layout()
+            return
+
+        path = self._button_paths[index]
+        next_upgrade = self.upgrade_manager.get_next_upgrade(self.tower, path)
+        if next_upgrade:
+            self.upgrade_buttons[index] = self._create_upgrade_button(next_upgrade)
+        else:
+            del self.upgrade_buttons[index]
+            del self._button_paths[index]
+        self._perform_layout_and_positioning()
+        self.update_hover_states()
+
+    def update_hover_states(self, mouse_pos: Optional[Tuple[int, int]] = None):
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
         self.is_close_hovered = self.close_button_rect.collidepoint(mouse_pos)
         self.is_salvage_hovered = self.salvage_button_rect.collidepoint(mouse_pos)
         self.is_persona_button_hovered = self.persona_change_button_rect.collidepoint(
@@ -173,29 +201,32 @@ class UpgradePanel(UIElement):
 
     def _create_button_objects(self):
         self.upgrade_buttons.clear()
-        padding = self.layout.get("padding_medium", 15)
-        width = self.rect.width - (padding * 2)
+        self._button_paths.clear()
         for path in ["path_a", "path_b"]:
             next_upgrade = self.upgrade_manager.get_next_upgrade(self.tower, path)
             if next_upgrade:
-                can_afford = self.game_state.gold >= next_upgrade.cost
-                button_rect = pygame.Rect(0, 0, width, 0)
-                self.upgrade_buttons.append(
-                    UpgradeButton(
-                        button_rect,
-                        next_upgrade,
-                        can_afford,
-                        self.ui_theme,
-                        self.font_manager,
-                    )
-                )
+                self.upgrade_buttons.append(self._create_upgrade_button(next_upgrade))
+                self._button_paths.append(path)
+
+    def _create_upgrade_button(self, upgrade: "Upgrade") -> UpgradeButton:
+        padding = self.layout.get("padding_medium", 15)
+        width = self.rect.width - (padding * 2)
+        can_afford = self.game_state.gold >= upgrade.cost
+        button_rect = pygame.Rect(0, 0, width, 0)
+        return UpgradeButton(
+            button_rect,
+            upgrade,
+            can_afford,
+            self.ui_theme,
+            self.font_manager,
+        )
 
     def handle_event(
         self, event: pygame.event.Event, game_state: "GameState"
     ) -> Optional[UIAction]:
         if event.type == pygame.MOUSEMOTION:
-            self.update_hover_states()
-        if not self.rect.collidepoint(pygame.mouse.get_pos()):
+            self.update_hover_states(event.pos)
+        if not self.rect.collidepoint(event.pos):
             return None
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.is_close_hovered:
@@ -3,7 +3,7 @@ import pygame
 import logging
 import uuid
 from pathlib import Path
-from typing import Dict, Any, List, Optional, TYPE_CHECKING
+from typing import Dict, Any, Callable, List, Optional, Tuple, TYPE_CHECKING
 from collections import OrderedDict
 
 from .buttons.tower_button import TowerButton
@@ -12,6 +12,8 @@ from .panels.upgrade_panel import UpgradePanel
 from .panels.tower_info_panel import TowerInfoPanel
 from .panels.persona_selection_panel import PersonaSelectionPanel
 from rendering.common.ui.ui_action import UIAction, ActionType
+from rendering.common.ui.ui_events import POSITIONAL_EVENT_TYPES
+from rendering.common.panels.panel_utils import to_display_format
 
 if TYPE_CHECKING:
     from game_logic.game_state import GameState
@@ -22,6 +24,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# How many (tab, screen size) tower button layouts are kept for reuse.
+_BUTTON_CACHE_SIZE = 8
+
 
 class UIManager:
     """
@@ -29,6 +34,58 @@ class UIManager:
     tower selection and informational panels for selected towers.
     """
 
+    # The manager is touched every frame; slots keep attribute access cheap.
+    # Every attribute assigned on the instance must be listed here.
+    __slots__ = (
+        "screen_rect",
+        "game_manager",
+        "progression_manager",
+        "tooltip_manager",
+        "assets_path",
+        "ui_theme",
+        "font_manager",
+        "_tower_types_cfg",
+        "_targeting_ai_cfg",
+        "_category_rank",
+        "colors",
+        "layout",
+        "hud_panel_height",
+        "tower_buttons",
+        "tab_buttons",
+        "active_tab",
+        "hotkey_map",
+        "info_panel",
+        "upgrade_panel",
+        "persona_panel",
+        "hovered_tower_button",
+        "_pad_medium",
+        "_panel_colors",
+        "_side_panel_rect",
+        "_resize_pending",
+        "_panel_rect",
+        "_persona_panel_pool",
+        "_last_selected",
+        "_tower_buttons_dirty",
+        "_button_grid",
+        "_hovered_index",
+        "_tower_bar_bounds",
+        "_tab_rects",
+        "_hovered_tab",
+        "_panel_surf",
+        "_panel_surf_key",
+        "_category_keys",
+        "_tower_by_id",
+        "_towers_by_category",
+        "_info_panel_tower_id",
+        "_button_cache",
+        "_button_cache_towers",
+        "_hud_cache",
+        "_hud_region",
+        "_hud_dirty",
+        "_last_gold",
+        "_action_handlers",
+    )
+
     def __init__(
         self,
         screen_rect: pygame.Rect,
@@ -49,21 +106,126 @@ class UIManager:
 
         self.colors = ui_theme.get("colors", {})
         self.layout = ui_theme.get("layout", {})
-        self.hud_panel_height = self.layout.get("hud_panel_height", 80)
+        self._cache_layout_constants()
 
         self.tower_buttons: List[TowerButton] = []
         self.tab_buttons: List[TabButton] = []
         self.active_tab: str = "all"
         self.hotkey_map: List[str] = []
+        self._category_keys: List[str] = []
+        self._tower_by_id: Dict[str, Dict[str, Any]] = {}
+        # Buildable tower ids per tab ("all" included), in config order.
+        self._towers_by_category: Dict[str, List[str]] = {}
+        self._button_cache: (
+            "OrderedDict[Tuple[str, int, int], Tuple[List[TowerButton], List[str]]]"
+        ) = OrderedDict()
+        # The buildable tower ids the category index and cached layouts were
+        # built from; None forces a rebuild.
+        self._button_cache_towers: Optional[Tuple[str, ...]] = None
+        # Tower button grid as (start_x, start_y, pitch, button_size, per_row),
+        # used to map a cursor position straight to a button index.
+        self._button_grid: Tuple[int, int, int, int, int] = (0, 0, 1, 0, 0)
+        self._hovered_index: Optional[int] = None
+        self._tower_bar_bounds = pygame.Rect(0, 0, 0, 0)
+        # Tab rects for collidelist() and the index of the hovered tab (-1: none).
+        self._tab_rects: List[pygame.Rect] = []
+        self._hovered_tab = -1
+
+        # Maps each UIAction type raised by the HUD panels and buttons to the
+        # method that carries it out.
+        self._action_handlers: Dict[
+            ActionType, Callable[[UIAction, "GameState"], None]
+        ] = {
+            ActionType.SELECT_TOWER: self._on_select_tower,
+            ActionType.CLOSE_PANEL: self._on_close_panel,
+            ActionType.SALVAGE_TOWER: self._on_salvage_tower,
+            ActionType.PURCHASE_UPGRADE: self._on_purchase_upgrade,
+            ActionType.OPEN_PERSONA_PANEL: self._on_open_persona_panel,
+            ActionType.CLOSE_PERSONA_PANEL: self._on_close_persona_panel,
+            ActionType.CHANGE_TARGETING_PERSONA: self._on_change_persona,
+        }
 
         self.info_panel: Optional[TowerInfoPanel] = None
+        # Id of the tower the info panel shows, so update() compares ids only.
+        self._info_panel_tower_id: Optional[str] = None
         self.upgrade_panel: Optional[UpgradePanel] = None
         self.persona_panel: Optional[PersonaSelectionPanel] = None
+        # The persona panel is built on first open and then reused.
+        self._persona_panel_pool: Optional[PersonaSelectionPanel] = None
         self.hovered_tower_button: Optional[TowerButton] = None
 
+        # Tower buttons only need ticking while something that affects them
+        # (hover, build selection, their own animation) is changing.
+        self._last_selected: Optional[str] = None
+        self._tower_buttons_dirty = True
+
+        self._side_panel_rect = pygame.Rect(0, 0, 0, 0)
+        self._resize_pending = False
+        self._panel_rect = pygame.Rect(0, 0, 0, 0)
+        self._panel_surf: Optional[pygame.Surface] = None
+
+        # Tabs and tower buttons are composited once into _hud_cache and only
+        # redrawn when they change; _hud_region is the screen area they cover.
+        self._hud_cache: Optional[pygame.Surface] = None
+        self._hud_region = pygame.Rect(0, 0, 0, 0)
+        self._hud_dirty = True
+        self._last_gold: Optional[int] = None
+        self._panel_surf_key: Optional[Tuple] = None
+
+        self.refresh_configs()
+        self._compute_layout()
         self._build_static_ui()
         self._build_dynamic_ui()
 
+    def refresh_configs(self):
+        """
+        Binds the config sections the HUD reads on its hot paths. Call again
+        (followed by a tower button rebuild) if the configs are reloaded.
+        """
+        configs = self.game_manager.configs
+        self._tower_types_cfg: Dict[str, Any] = configs.get("tower_types", {})
+        self._targeting_ai_cfg: Dict[str, Any] = configs.get("targeting_ai", {})
+        # Canonical tab order: categories rank by their first appearance in the
+        # tower configs, so it only needs computing when the configs change.
+        self._category_rank: Dict[str, int] = {}
+        for config in self._tower_types_cfg.values():
+            if isinstance(config, dict) and (category := config.get("category")):
+                self._category_rank.setdefault(category, len(self._category_rank))
+        # Cached tower buttons hold references to the previous tower configs.
+        self._button_cache.clear()
+        self._button_cache_towers = None
+
+    def _cache_layout_constants(self):
+        """Resolves the theme values used by the per-frame paths once."""
+        self.hud_panel_height = self.layout.get("hud_panel_height", 80)
+        self._pad_medium = self.layout.get("padding_medium", 15)
+        # Top, bottom and highlight colours of the tower bar background.
+        self._panel_colors = (
+            tuple(self.colors.get("panel_secondary", [40, 50, 60])),
+            tuple(self.colors.get("panel_primary", [25, 30, 40])),
+            tuple(self.colors.get("border_interactive_selected", (150, 180, 200))),
+        )
+
+    def _compute_layout(self):
+        """
+        Pre-computes screen-dependent geometry that only changes on resize, so
+        opening a panel doesn't have to recalculate (and re-allocate) it.
+        """
+        panel_width = self.screen_rect.width * 0.25
+        self._side_panel_rect = pygame.Rect(
+            self.screen_rect.right - panel_width - self._pad_medium,
+            self.screen_rect.y + self._pad_medium,
+            panel_width,
+            self.screen_rect.height * 0.9,
+        )
+        # Background of the tower bar along the bottom edge.
+        self._panel_rect = pygame.Rect(
+            0,
+            self.screen_rect.height - self.hud_panel_height,
+            self.screen_rect.width,
+            self.hud_panel_height,
+        )
+
     def _build_static_ui(self):
         pass
 
@@ -71,44 +233,30 @@ class UIManager:
         self._rebuild_tower_buttons()
 
     def _rebuild_tower_buttons(self):
-        self.tower_buttons.clear()
+        self._tower_buttons_dirty = True
+        self._hud_dirty = True
         self.tab_buttons.clear()
-        self.hotkey_map.clear()
-
-        buildable_tower_ids = self.game_manager.get_buildable_towers()
-        all_tower_configs = self.game_manager.configs.get("tower_types", {})
-
-        canonical_category_order = []
-        for tower_id, config in all_tower_configs.items():
-            if isinstance(config, dict):
-                category = config.get("category")
-                if category and category not in canonical_category_order:
-                    canonical_category_order.append(category)
 
-        available_categories_set = set()
-        for t_id in buildable_tower_ids:
-            if isinstance(tower_data := all_tower_configs.get(t_id), dict):
-                available_categories_set.add(tower_data.get("category", "basic"))
-
-        sorted_available_categories = sorted(
-            list(available_categories_set),
-            key=lambda cat: (
-                canonical_category_order.index(cat)
-                if cat in canonical_category_order
-                else float("inf")
-            ),
-        )
-        categories = ["all"] + sorted_available_categories
+        # The category index only changes when the buildable set does, so tab
+        # switches and resizes reuse it.
+        buildable_key = tuple(self.game_manager.get_buildable_towers())
+        if buildable_key != self._button_cache_towers:
+            self._index_buildable_towers(buildable_key)
+            # Unlocking or losing a tower invalidates every cached tab layout.
+            self._button_cache.clear()
+            self._button_cache_towers = buildable_key
+        categories = self._category_keys
 
         tab_button_width = 80
         tab_button_height = 30
         tab_x_start = (
             self.screen_rect.centerx - (len(categories) * tab_button_width) // 2
         )
+        tab_y = self.screen_rect.bottom - self.hud_panel_height - tab_button_height - 5
         for i, category in enumerate(categories):
             rect = pygame.Rect(
                 tab_x_start + i * tab_button_width,
-                self.screen_rect.bottom - self.hud_panel_height - tab_button_height - 5,
+                tab_y,
                 tab_button_width,
                 tab_button_height,
             )
@@ -117,39 +265,76 @@ class UIManager:
                 TabButton(rect, category, is_active, self.ui_theme, self.font_manager)
             )
 
-        filtered_tower_ids = []
-        for t_id in buildable_tower_ids:
-            tower_data = all_tower_configs.get(t_id, {})
-            if isinstance(tower_data, dict):
-                if (
-                    self.active_tab == "all"
-                    or tower_data.get("category") == self.active_tab
-                ):
-                    filtered_tower_ids.append(t_id)
-
-        self.hotkey_map = filtered_tower_ids
         button_size = 64
         button_spacing = 15
-        num_buttons_per_row = (self.screen_rect.width - 2 * button_spacing) // (
-            button_size + button_spacing
-        )
+        pitch = button_size + button_spacing
+        num_buttons_per_row = (self.screen_rect.width - 2 * button_spacing) // pitch
         start_x = (
             self.screen_rect.centerx
-            - (num_buttons_per_row * (button_size + button_spacing) - button_spacing)
-            // 2
+            - (num_buttons_per_row * pitch - button_spacing) // 2
+        )
+        y_base = self.screen_rect.bottom - self.hud_panel_height + button_spacing
+        self._button_grid = (start_x, y_base, pitch, button_size, num_buttons_per_row)
+        self._hovered_index = None
+        self._tab_rects = [b.rect for b in self.tab_buttons]
+        self._hovered_tab = -1
+
+        # Tower buttons are expensive to build (each one loads its icon from
+        # disk), so layouts are reused when switching back to a tab.
+        key = (self.active_tab, self.screen_rect.w, self.screen_rect.h)
+        cached = self._button_cache.get(key)
+        if cached is not None:
+            self._button_cache.move_to_end(key)
+            for button in cached[0]:
+                button.is_hovered = False
+        else:
+            cached = self._build_tower_buttons()
+            self._button_cache[key] = cached
+            if len(self._button_cache) > _BUTTON_CACHE_SIZE:
+                self._button_cache.popitem(last=False)
+        self.tower_buttons, self.hotkey_map = cached
+
+        # Bounding box of everything on the bar, for rejecting stray events.
+        rects = [b.base_rect for b in self.tower_buttons]
+        rects += [b.rect for b in self.tab_buttons]
+        self._tower_bar_bounds = (
+            rects[0].unionall(rects[1:]) if rects else pygame.Rect(0, 0, 0, 0)
+        )
+
+    def _index_buildable_towers(self, buildable_tower_ids: Tuple[str, ...]):
+        """Groups the buildable towers by category and orders the tabs."""
+        buildable_set = set(buildable_tower_ids)
+        # An open info panel may hold a config that is no longer current.
+        self._info_panel_tower_id = None
+        self._tower_by_id = {}
+        self._towers_by_category = {"all": []}
+        # A single pass over the configs yields the buildable towers (in config
+        # order) and the categories they use.
+        for tower_id, config in self._tower_types_cfg.items():
+            if not isinstance(config, dict) or tower_id not in buildable_set:
+                continue
+            self._tower_by_id[tower_id] = config
+            self._towers_by_category["all"].append(tower_id)
+            category = config.get("category", "basic")
+            self._towers_by_category.setdefault(category, []).append(tower_id)
+
+        sorted_available_categories = sorted(
+            (cat for cat in self._towers_by_category if cat != "all"),
+            key=lambda cat: self._category_rank.get(cat, float("inf")),
         )
+        self._category_keys = ["all"] + sorted_available_categories
 
+    def _build_tower_buttons(self) -> Tuple[List[TowerButton], List[str]]:
+        """Creates the tower buttons for the active tab on the current grid."""
+        start_x, y_base, pitch, button_size, num_buttons_per_row = self._button_grid
+        filtered_tower_ids = self._towers_by_category.get(self.active_tab, [])
+
+        tower_buttons = []
         for i, tower_id in enumerate(filtered_tower_ids):
-            tower_data = all_tower_configs.get(tower_id, {})
-            row = i // num_buttons_per_row
-            col = i % num_buttons_per_row
-            x = start_x + col * (button_size + button_spacing)
-            y = (
-                self.screen_rect.bottom
-                - self.hud_panel_height
-                + button_spacing
-                + row * (button_size + button_spacing)
-            )
+            tower_data = self._tower_by_id[tower_id]
+            row, col = divmod(i, num_buttons_per_row)
+            x = start_x + col * pitch
+            y = y_base + row * pitch
             button = TowerButton(
                 pygame.Rect(x, y, button_size, button_size),
                 tower_id,
@@ -159,13 +344,36 @@ class UIManager:
                 self.ui_theme,
                 self.font_manager,
             )
-            self.tower_buttons.append(button)
+            tower_buttons.append(button)
+        return tower_buttons, filtered_tower_ids
+
+    def _clear_hover(self):
+        if self._hovered_tab != -1:
+            self.tab_buttons[self._hovered_tab].is_hovered = False
+            self._hovered_tab = -1
+        if self._hovered_index is not None:
+            self.tower_buttons[self._hovered_index].is_hovered = False
+            self._hovered_index = None
+        self._tower_buttons_dirty = True
+
+    def _button_index_at(self, pos: Tuple[int, int]) -> Optional[int]:
+        """
+        Returns the index of the tower button whose resting rect contains pos,
+        found by inverting the grid layout rather than testing every button.
+        """
+        start_x, start_y, pitch, size, per_row = self._button_grid
+        col, dx = divmod(pos[0] - start_x, pitch)
+        row, dy = divmod(pos[1] - start_y, pitch)
+        if row < 0 or not 0 <= col < per_row or dx >= size or dy >= size:
+            return None
+        index = row * per_row + col
+        return index if index < len(self.tower_buttons) else None
 
     def set_active_category_by_index(self, index: int):
-        if index < 0 or index >= len(self.tab_buttons):
+        if index < 0 or index >= len(self._category_keys):
             logger.warning(f"Hotkey index {index} is out of range. Ignoring.")
             return
-        self.active_tab = self.tab_buttons[index].category_name
+        self.active_tab = self._category_keys[index]
         self._rebuild_tower_buttons()
         logger.info(f"Active category changed to: {self.active_tab}")
 
@@ -181,72 +389,63 @@ class UIManager:
     def _open_upgrade_panel(self, tower_id: uuid.UUID):
         tower = self.game_manager.towers.get(tower_id)
         if tower:
-            panel_width = self.screen_rect.width * 0.25
-            panel_rect = pygame.Rect(
-                self.screen_rect.right
-                - panel_width
-                - self.layout.get("padding_medium", 15),
-                self.screen_rect.y + self.layout.get("padding_medium", 15),
-                panel_width,
-                self.screen_rect.height * 0.9,
-            )
+            # Panels resize their own rect, so each one gets a private copy.
+            panel_rect = self._side_panel_rect.copy()
             self.upgrade_panel = UpgradePanel(
                 rect=panel_rect,
                 tower=tower,
-                tower_base_data=self.game_manager.configs["tower_types"].get(
-                    tower.tower_type_id
-                ),
+                tower_base_data=self._tower_types_cfg.get(tower.tower_type_id),
                 upgrade_manager=self.game_manager.upgrade_manager,
                 game_state=self.game_manager.game_state,
                 salvage_refund_percentage=self.game_manager.game_settings.get(
                     "salvage_refund_percentage", 0.5
                 ),
-                targeting_ai_config=self.game_manager.configs.get("targeting_ai", {}),
+                targeting_ai_config=self._targeting_ai_cfg,
                 ui_theme=self.ui_theme,
                 font_manager=self.font_manager,
                 tooltip_manager=self.tooltip_manager,
             )
 
     def _open_info_panel(self, tower_id: str):
-        tower_data = self.game_manager.configs["tower_types"].get(tower_id)
+        tower_data = self._tower_by_id.get(tower_id)
         if tower_data:
-            panel_width = self.screen_rect.width * 0.25
-            panel_rect = pygame.Rect(
-                self.screen_rect.right
-                - panel_width
-                - self.layout.get("padding_medium", 15),
-                self.screen_rect.y + self.layout.get("padding_medium", 15),
-                panel_width,
-                self.screen_rect.height * 0.9,
-            )
+            panel_rect = self._side_panel_rect.copy()
             self.info_panel = TowerInfoPanel(
                 rect=panel_rect,
                 tower_data=tower_data,
-                targeting_ai_config=self.game_manager.configs.get("targeting_ai", {}),
+                targeting_ai_config=self._targeting_ai_cfg,
                 ui_theme=self.ui_theme,
                 font_manager=self.font_manager,
                 tooltip_manager=self.tooltip_manager,
             )
+            self._info_panel_tower_id = tower_id
 
     def _close_panel(self):
         self.info_panel = None
         self.upgrade_panel = None
+        self._info_panel_tower_id = None
 
     def _open_persona_panel(self):
         if self.upgrade_panel and self.upgrade_panel.tower:
             tower = self.upgrade_panel.tower
-            all_personas = self.game_manager.configs.get("targeting_ai", {})
+            all_personas = self._targeting_ai_cfg
             eligible_personas = tower.get_eligible_personas(all_personas)
             active_persona = tower.current_persona
-            self.persona_panel = PersonaSelectionPanel(
-                screen_rect=self.screen_rect,
-                all_personas=all_personas,
-                eligible_personas=eligible_personas,
-                active_persona=active_persona,
-                ui_theme=self.ui_theme,
-                font_manager=self.font_manager,
-                tooltip_manager=self.tooltip_manager,
-            )
+            if self._persona_panel_pool is None:
+                self._persona_panel_pool = PersonaSelectionPanel(
+                    screen_rect=self.screen_rect,
+                    all_personas=all_personas,
+                    eligible_personas=eligible_personas,
+                    active_persona=active_persona,
+                    ui_theme=self.ui_theme,
+                    font_manager=self.font_manager,
+                    tooltip_manager=self.tooltip_manager,
+                )
+            else:
+                self._persona_panel_pool.reset(
+                    all_personas, eligible_personas, active_persona
+                )
+            self.persona_panel = self._persona_panel_pool
 
     def _close_persona_panel(self):
         self.persona_panel = None
@@ -258,75 +457,132 @@ class UIManager:
             )
             self._close_persona_panel()
 
+    def _process_ui_action(self, action: UIAction, game_state: "GameState"):
+        handler = self._action_handlers.get(action.type)
+        if handler:
+            handler(action, game_state)
+
+    def _on_select_tower(self, action: UIAction, game_state: "GameState"):
+        game_state.selected_tower_to_build = action.entity_id
+
+    def _on_close_panel(self, action: UIAction, game_state: "GameState"):
+        self._close_panel()
+
+    def _on_salvage_tower(self, action: UIAction, game_state: "GameState"):
+        self.game_manager.salvage_tower(self.upgrade_panel.tower.entity_id)
+        self._close_panel()
+
+    def _on_purchase_upgrade(self, action: UIAction, game_state: "GameState"):
+        self.game_manager.purchase_tower_upgrade(
+            self.upgrade_panel.tower.entity_id, action.entity_id
+        )
+        self.upgrade_panel.refresh_upgrade(action.entity_id)
+
+    def _on_open_persona_panel(self, action: UIAction, game_state: "GameState"):
+        self._open_persona_panel()
+
+    def _on_close_persona_panel(self, action: UIAction, game_state: "GameState"):
+        self._close_persona_panel()
+
+    def _on_change_persona(self, action: UIAction, game_state: "GameState"):
+        self._change_persona(action.entity_id)
+
     def on_resize(self, new_screen_rect: pygame.Rect):
+        # Dragging a window edge emits a burst of resize events, so the rebuild
+        # is deferred to the next update() and runs once per frame at most.
         self.screen_rect = new_screen_rect
-        self.hud_panel_height = self.layout.get("hud_panel_height", 80)
+        self._resize_pending = True
+
+    def _apply_resize(self):
+        self._resize_pending = False
+        self._cache_layout_constants()
+        self._compute_layout()
+        self._panel_surf = None
         self._rebuild_tower_buttons()
         if self.info_panel:
-            self.info_panel.on_resize(new_screen_rect)
+            self.info_panel.on_resize(self.screen_rect)
         if self.upgrade_panel:
-            self.upgrade_panel.on_resize(new_screen_rect)
-        if self.persona_panel:
-            self.persona_panel.on_resize(new_screen_rect)
+            self.upgrade_panel.on_resize(self.screen_rect)
+        # The pooled persona panel is kept in sync even while it is closed.
+        if self._persona_panel_pool:
+            self._persona_panel_pool.on_resize(self.screen_rect)
 
     def handle_event(self, event: pygame.event.Event, game_state: "GameState") -> bool:
+        if event.type not in POSITIONAL_EVENT_TYPES:
+            return False
+        if self._resize_pending:
+            # Input in the same batch as a resize must hit the new layout.
+            self._apply_resize()
+
         if self.persona_panel:
             action = self.persona_panel.handle_event(event, game_state)
             if action:
-                if action.type == ActionType.CLOSE_PERSONA_PANEL:
-                    self._close_persona_panel()
-                elif action.type == ActionType.CHANGE_TARGETING_PERSONA:
-                    self._change_persona(action.entity_id)
+                self._process_ui_action(action, game_state)
                 return True
-            if hasattr(event, "pos"):
-                return self.persona_panel.rect.collidepoint(event.pos)
-            return False
+            return self.persona_panel.rect.collidepoint(event.pos)
 
         if self.upgrade_panel:
             action = self.upgrade_panel.handle_event(event, game_state)
             if action:
-                if action.type == ActionType.CLOSE_PANEL:
-                    self._close_panel()
-                elif action.type == ActionType.SALVAGE_TOWER:
-                    self.game_manager.salvage_tower(self.upgrade_panel.tower.entity_id)
-                    self._close_panel()
-                elif action.type == ActionType.PURCHASE_UPGRADE:
-                    self.game_manager.purchase_tower_upgrade(
-                        self.upgrade_panel.tower.entity_id, action.entity_id
-                    )
-                    self.upgrade_panel.rebuild_layout()
-                elif action.type == ActionType.OPEN_PERSONA_PANEL:
-                    self._open_persona_panel()
+                self._process_ui_action(action, game_state)
                 return True
-            if hasattr(event, "pos"):
-                return self.upgrade_panel.rect.collidepoint(event.pos)
-            return False
+            return self.upgrade_panel.rect.collidepoint(event.pos)
 
         if self.info_panel:
-            if hasattr(event, "pos") and self.info_panel.rect.collidepoint(event.pos):
+            if self.info_panel.rect.collidepoint(event.pos):
                 return True
 
-        for button in self.tab_buttons:
-            if (
-                event.type == pygame.MOUSEBUTTONDOWN
-                and event.button == 1
-                and button.rect.collidepoint(event.pos)
-            ):
-                self.active_tab = button.category_name.lower()
-                self._rebuild_tower_buttons()
-                return True
-            if hasattr(event, "pos"):
-                button.is_hovered = button.rect.collidepoint(event.pos)
+        if not self._tower_bar_bounds.collidepoint(event.pos):
+            # Nowhere near the bar: only drop any hover left from before.
+            if self._hovered_index is not None or self._hovered_tab != -1:
+                self._clear_hover()
+            return False
 
-        for button in self.tower_buttons:
+        # One C-level scan over the tab rects instead of a Python loop.
+        tab = pygame.Rect(event.pos, (1, 1)).collidelist(self._tab_rects)
+        if tab != -1 and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.active_tab = self.tab_buttons[tab].category_name.lower()
+            self._rebuild_tower_buttons()
+            return True
+
+        # Hover can only change when the cursor moves.
+        if event.type == pygame.MOUSEMOTION:
+            if tab != self._hovered_tab:
+                if self._hovered_tab != -1:
+                    self.tab_buttons[self._hovered_tab].is_hovered = False
+                if tab != -1:
+                    self.tab_buttons[tab].is_hovered = True
+                self._hovered_tab = tab
+                self._tower_buttons_dirty = True
+
+        # Hover is resolved against the resting grid rather than by
+        # dispatching to every button. This also keeps a raised button from
+        # losing hover when it animates away from the cursor. Clicks resolve
+        # it too, since no motion event may have followed a rebuild.
+        index = self._button_index_at(event.pos)
+        if index != self._hovered_index:
+            if self._hovered_index is not None:
+                self.tower_buttons[self._hovered_index].is_hovered = False
+            if index is not None:
+                self.tower_buttons[index].is_hovered = True
+            self._hovered_index = index
+            self._tower_buttons_dirty = True
+        if event.type == pygame.MOUSEMOTION:
+            return False
+
+        # Only the button under the cursor can act on a click.
+        if self._hovered_index is not None:
+            button = self.tower_buttons[self._hovered_index]
             action = button.handle_event(event, game_state)
             if action:
-                if action.type == ActionType.SELECT_TOWER:
-                    game_state.selected_tower_to_build = action.entity_id
+                self._process_ui_action(action, game_state)
                 return True
         return False
 
     def update(self, dt: float, game_state: "GameState"):
+        if self._resize_pending:
+            self._apply_resize()
+
         if game_state.selected_entity_id:
             if (
                 not self.upgrade_panel
@@ -336,13 +592,7 @@ class UIManager:
                 self._open_upgrade_panel(game_state.selected_entity_id)
 
         elif game_state.selected_tower_to_build:
-            if not self.info_panel or self.info_panel.tower_data.get(
-                "name"
-            ) != self.game_manager.configs["tower_types"][
-                game_state.selected_tower_to_build
-            ].get(
-                "name"
-            ):
+            if game_state.selected_tower_to_build != self._info_panel_tower_id:
                 self._close_panel()
                 self._open_info_panel(game_state.selected_tower_to_build)
 
@@ -357,54 +607,105 @@ class UIManager:
         elif self.info_panel:
             self.info_panel.update(dt, game_state)
 
-        self.hovered_tower_button = None
-        for button in self.tower_buttons:
-            button.update(dt, game_state)
-            if button.is_hovered:
-                self.hovered_tower_button = button
-
-    # --- MODIFIED: Enhanced styling for the tower bar (Step 2.1) ---
-    def draw(self, screen: pygame.Surface, game_state: "GameState"):
-        """Draws all UI elements, including the newly styled tower bar."""
-        panel_rect = pygame.Rect(
-            0,
-            self.screen_rect.height - self.hud_panel_height,
-            self.screen_rect.width,
-            self.hud_panel_height,
-        )
-
-        # Create a dedicated surface for the panel to draw gradients and effects on.
-        panel_surf = pygame.Surface(panel_rect.size, pygame.SRCALPHA)
-
-        # Define gradient colors from the theme.
-        color_top = self.colors.get("panel_secondary", [40, 50, 60])
-        color_bottom = self.colors.get("panel_primary", [25, 30, 40])
-
-        # Draw the gradient by iterating through each vertical line of the panel.
-        for y in range(panel_rect.height):
+        if game_state.gold != self._last_gold:
+            # Affordability colours on the tower buttons depend on gold.
+            self._last_gold = game_state.gold
+            self._hud_dirty = True
+
+        selected = game_state.selected_tower_to_build
+        if self._tower_buttons_dirty or selected != self._last_selected:
+            self._last_selected = selected
+            self._hud_dirty = True
+            self.hovered_tower_button = None
+            is_animating = False
+            for button in self.tower_buttons:
+                button.update(dt, game_state)
+                if button.is_hovered:
+                    self.hovered_tower_button = button
+                is_animating = is_animating or button.is_animating
+            self._tower_buttons_dirty = is_animating
+
+    def _build_panel_surface(
+        self,
+        size: Tuple[int, int],
+        color_top: Tuple[int, ...],
+        color_bottom: Tuple[int, ...],
+        highlight_color: Tuple[int, ...],
+    ) -> pygame.Surface:
+        """Renders the translucent gradient background of the tower bar."""
+        width, height = size
+        if not width or not height:
+            return pygame.Surface(size, pygame.SRCALPHA)
+
+        # The gradient only varies vertically, so build a single-pixel-wide
+        # column of RGBA bytes and stretch it across the panel in one call
+        # instead of drawing a line per row.
+        column = bytearray()
+        for y in range(height):
             # Interpolate color from top to bottom
-            ratio = y / panel_rect.height
+            ratio = y / height
             r = int(color_top[0] * (1 - ratio) + color_bottom[0] * ratio)
             g = int(color_top[1] * (1 - ratio) + color_bottom[1] * ratio)
             b = int(color_top[2] * (1 - ratio) + color_bottom[2] * ratio)
-
-            # Draw a horizontal line with the calculated color and alpha.
-            pygame.draw.line(panel_surf, (r, g, b, 220), (0, y), (panel_rect.width, y))
+            column += bytes((r, g, b, 220))
+        gradient = pygame.image.frombuffer(bytes(column), (1, height), "RGBA")
+        panel_surf = pygame.transform.scale(gradient, size)
 
         # Add a bright inner highlight along the top edge for a nice finish.
-        highlight_color = self.colors.get(
-            "border_interactive_selected", (150, 180, 200)
+        pygame.draw.line(panel_surf, highlight_color, (0, 0), (width, 0), 2)
+        return to_display_format(panel_surf)
+
+    def _redraw_hud_cache(self, screen_rect: pygame.Rect, game_state: "GameState"):
+        """
+        Composites the tower bar background, tabs and tower buttons onto the
+        cached HUD surface, which only covers the screen area they occupy.
+        """
+        region = self._panel_rect.unionall(
+            [e.rect for e in self.tower_buttons + self.tab_buttons]
+        ).clip(screen_rect)
+        if self._hud_cache is None or self._hud_cache.get_size() != region.size:
+            self._hud_cache = to_display_format(
+                pygame.Surface(region.size, pygame.SRCALPHA)
+            )
+        else:
+            self._hud_cache.fill((0, 0, 0, 0))
+
+        # Each button hands back its pre-composed surface, so the whole layer
+        # goes to SDL in a single blits() call, shifted into cache space.
+        dx, dy = -region.x, -region.y
+        self._hud_cache.blits(
+            [
+                (surf, rect.move(dx, dy))
+                for surf, rect in [(self._panel_surf, self._panel_rect)]
+                + [button.render(game_state) for button in self.tower_buttons]
+                + [button.render() for button in self.tab_buttons]
+            ],
+            doreturn=False,
         )
-        pygame.draw.line(panel_surf, highlight_color, (0, 0), (panel_rect.width, 0), 2)
 
-        # Blit the final styled surface to the screen.
-        screen.blit(panel_surf, panel_rect.topleft)
+        self._hud_region = region
+        self._hud_dirty = False
 
-        # Draw the rest of the UI elements on top of the new panel.
-        for button in self.tower_buttons:
-            button.draw(screen, game_state)
-        for button in self.tab_buttons:
-            button.draw(screen)
+    # --- MODIFIED: Enhanced styling for the tower bar (Step 2.1) ---
+    def draw(self, screen: pygame.Surface, game_state: "GameState"):
+        """Draws all UI elements, including the newly styled tower bar."""
+        panel_rect = self._panel_rect
+
+        # --- OPTIMIZED: The panel background is static, so it is only rebuilt
+        # when its size or theme colors change instead of every frame. ---
+        key = (panel_rect.size, self._panel_colors)
+        if self._panel_surf is None or self._panel_surf_key != key:
+            self._panel_surf = self._build_panel_surface(
+                panel_rect.size, *self._panel_colors
+            )
+            self._panel_surf_key = key
+            self._hud_dirty = True
+
+        # The whole tower bar (background, tabs and buttons) is one cached
+        # layer, so an unchanged bar costs a single blit per frame.
+        if self._hud_dirty or self._hud_cache is None:
+            self._redraw_hud_cache(screen.get_rect(), game_state)
+        screen.blit(self._hud_cache, self._hud_region.topleft)
 
         if self.upgrade_panel:
             self.upgrade_panel.draw(screen)
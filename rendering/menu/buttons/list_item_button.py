@@ -1,9 +1,11 @@
 # rendering/menu/buttons/list_item_button.py
 import pygame
 import logging
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple, Optional, TYPE_CHECKING
 
 from rendering.common.ui.ui_element import UIElement
+from rendering.common.panels.panel_utils import to_display_format
 
 if TYPE_CHECKING:
     from rendering.text.font_manager import FontManager
@@ -11,6 +13,25 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=512)
+def _render_text(font: pygame.font.Font, text: str, color: Tuple[int, ...]):
+    """
+    Renders text once per (font, text, color). List items repeat the same
+    strings ("UNLOCKED", stat labels, costs), so later items reuse the surface.
+    """
+    return font.render(text, True, color)
+
+
+def _render_cached(font: pygame.font.Font, text: str, color) -> pygame.Surface:
+    # Theme colors may be lists or pygame.Color objects; neither can be a cache key.
+    return _render_text(font, text, tuple(color))
+
+
+def clear_render_cache():
+    """Drops all cached text surfaces, e.g. after the theme or fonts reload."""
+    _render_text.cache_clear()
+
+
 class ListItemButton(UIElement):
     """
     A highly dynamic and reusable button for items in a scrollable list,
@@ -18,6 +39,11 @@ class ListItemButton(UIElement):
     based on its state (locked, selected, hover) and passed-in data.
     """
 
+    # Set whenever a visual state changes; cleared once the button is re-rendered.
+    is_dirty = True
+    _is_hovered = False
+    _is_selected = False
+
     def __init__(
         self,
         rect: pygame.Rect,
@@ -43,6 +69,29 @@ class ListItemButton(UIElement):
 
         self._load_theme_assets()
 
+        # The rendered button, reused until is_dirty is set or the size changes.
+        self._cached_surface: Optional[pygame.Surface] = None
+
+    @property
+    def is_hovered(self) -> bool:
+        return self._is_hovered
+
+    @is_hovered.setter
+    def is_hovered(self, value: bool):
+        if value != self._is_hovered:
+            self._is_hovered = value
+            self.is_dirty = True
+
+    @property
+    def is_selected(self) -> bool:
+        return self._is_selected
+
+    @is_selected.setter
+    def is_selected(self, value: bool):
+        if value != self._is_selected:
+            self._is_selected = value
+            self.is_dirty = True
+
     def _load_theme_assets(self):
         """Loads all necessary fonts and style values from the theme config."""
         self.colors = self.ui_theme.get("colors", {})
@@ -53,96 +102,144 @@ class ListItemButton(UIElement):
         self.font_stat_value = self.font_manager.get_font("body_tiny_bold")
         self.font_locked = self.font_manager.get_font("title_small")
 
+        # Resolve every style value _compose needs once, instead of per render.
+        # Colours become pygame.Color objects so draw calls skip re-parsing them.
+        self._border_radius = self.layout.get("border_radius_large", 8)
+        self._border_width = self.layout.get("border_width_standard", 2)
+        self._border_width_selected = self.layout.get("border_width_selected", 3)
+        self._padding = self.layout.get("padding_medium", 15)
+        self._panel_primary = self._theme_color("panel_primary")
+        self._panel_secondary = self._theme_color("panel_secondary")
+        self._panel_hover = self._theme_color("panel_interactive_hover")
+        self._border_primary = self._theme_color("border_primary")
+        self._border_selected = self._theme_color("border_interactive_selected")
+        self._text_primary = self._theme_color("text_primary")
+        self._text_secondary = self._theme_color("text_secondary")
+        self._text_disabled = self._theme_color("text_disabled")
+
+        self._resolve_status_color()
+
+    def _resolve_status_color(self):
+        """Picks the status text colour, which only depends on the item data."""
+        if self.is_locked:
+            self._status_color = self._text_disabled
+        elif self.status_text and "UNLOCKED" in self.status_text:
+            self._status_color = self._theme_color("text_success")
+        elif self.can_afford:
+            self._status_color = self._theme_color("text_accent")
+        else:
+            self._status_color = self._theme_color("text_error")
+
+    def set_locked(self, is_locked: bool):
+        """Updates the button's lock state, e.g. after its item was unlocked."""
+        if is_locked == self.is_locked:
+            return
+        self.is_locked = is_locked
+        self.item_data["is_locked"] = is_locked
+        self._resolve_status_color()
+        self.is_dirty = True
+
+    def _theme_color(self, key: str) -> Optional[pygame.Color]:
+        """Returns the theme colour for key as a pygame.Color, or None if unset."""
+        value = self.colors.get(key)
+        return pygame.Color(value) if value is not None else None
+
     def draw(self, screen: pygame.Surface):
         """
         Draws the button with complex styling based on its state.
 
         This method now includes clearer visual feedback for hover and selection states,
-        using different colors, borders, and border widths.
+        using different colors, borders, and border widths. The fully rendered
+        button is cached and only re-rendered when its state or size changes.
         """
-        border_radius = self.layout.get("border_radius_large", 8)
-        border_width = self.layout.get("border_width_standard", 2)
-        padding = self.layout.get("padding_medium", 15)
+        screen.blit(*self.render())
+
+    def render(self) -> Tuple[pygame.Surface, pygame.Rect]:
+        """
+        Returns the button's composited surface and its destination rect,
+        re-rendering it first if its state or size changed.
+        """
+        if (
+            self.is_dirty
+            or self._cached_surface is None
+            or self._cached_surface.get_size() != self.rect.size
+        ):
+            self._cached_surface = to_display_format(
+                pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            )
+            self._compose(self._cached_surface, self._cached_surface.get_rect())
+            self.is_dirty = False
+        return self._cached_surface, self.rect
+
+    def _compose(self, surface: pygame.Surface, rect: pygame.Rect):
+        """Renders the button's background, border and text into rect."""
+        border_radius = self._border_radius
+        border_width = self._border_width
+        padding = self._padding
 
         # 1. Determine Colors and Styles based on State
-        bg_color = self.colors.get("panel_primary")
-        border_color = self.colors.get("border_primary")
-        title_color = self.colors.get("text_primary")
-        text_color_secondary = self.colors.get("text_secondary")
+        title_color = self._text_primary
+        text_color_secondary = self._text_secondary
 
         if self.is_locked:
             # Locked state is visually distinct, with muted colors
-            bg_color = self.colors.get("panel_primary")
-            border_color = self.colors.get("border_primary")
-            title_color = self.colors.get("text_disabled")
-            text_color_secondary = self.colors.get("text_disabled")
+            bg_color = self._panel_primary
+            border_color = self._border_primary
+            title_color = self._text_disabled
+            text_color_secondary = self._text_disabled
         elif self.is_selected:
             # Selected state has a border color that matches the new theme, not the old yellow
-            bg_color = self.colors.get("panel_secondary")
-            border_color = self.colors.get("border_interactive_selected")
-            border_width = self.layout.get("border_width_selected", 3)
+            bg_color = self._panel_secondary
+            border_color = self._border_selected
+            border_width = self._border_width_selected
         elif self.is_hovered:
             # Hover state for interactive feedback
-            bg_color = self.colors.get("panel_interactive_hover")
-            border_color = self.colors.get("border_interactive_selected")
+            bg_color = self._panel_hover
+            border_color = self._border_selected
         else:
             # Default state
-            bg_color = self.colors.get("panel_primary")
-            border_color = self.colors.get("border_primary")
-            border_width = self.layout.get("border_width_standard", 2)
+            bg_color = self._panel_primary
+            border_color = self._border_primary
 
         # 2. Draw Background and Border
-        pygame.draw.rect(screen, bg_color, self.rect, border_radius=border_radius)
+        pygame.draw.rect(surface, bg_color, rect, border_radius=border_radius)
         pygame.draw.rect(
-            screen, border_color, self.rect, border_width, border_radius=border_radius
+            surface, border_color, rect, border_width, border_radius=border_radius
         )
 
         # 3. Draw Content
         # Title
-        title_surf = self.font_title.render(self.title, True, title_color)
-        screen.blit(title_surf, (self.rect.x + padding, self.rect.y + 10))
+        title_surf = _render_cached(self.font_title, self.title, title_color)
+        surface.blit(title_surf, (rect.x + padding, rect.y + 10))
 
         # Status Text (top-right)
         if self.status_text:
-            status_color = (
-                self.colors.get("text_accent")
-                if self.can_afford
-                else self.colors.get("text_error")
+            status_surf = _render_cached(
+                self.font_status, self.status_text, self._status_color
             )
-            if "UNLOCKED" in self.status_text:
-                status_color = self.colors.get("text_success")
-
-            if self.is_locked:
-                status_color = self.colors.get("text_disabled")
-
-            status_surf = self.font_status.render(self.status_text, True, status_color)
             status_rect = status_surf.get_rect(
-                topright=(self.rect.right - padding, self.rect.y + 12)
+                topright=(rect.right - padding, rect.y + 12)
             )
-            screen.blit(status_surf, status_rect)
+            surface.blit(status_surf, status_rect)
 
         # Lock Icon (if locked)
         if self.is_locked:
-            lock_surf = self.font_locked.render(
-                "🔒", True, self.colors.get("text_disabled")
-            )
+            lock_surf = _render_cached(self.font_locked, "🔒", self._text_disabled)
             lock_rect = lock_surf.get_rect(
-                centery=self.rect.centery, right=self.rect.right - padding
+                centery=rect.centery, right=rect.right - padding
             )
-            screen.blit(lock_surf, lock_rect)
+            surface.blit(lock_surf, lock_rect)
 
         # Stats
-        current_y = self.rect.y + 40
+        current_y = rect.y + 40
         for label, value in self.stats:
-            label_surf = self.font_stat_label.render(
-                f"{label}:", True, text_color_secondary
+            label_surf = _render_cached(
+                self.font_stat_label, f"{label}:", text_color_secondary
             )
-            value_surf = self.font_stat_value.render(value, True, title_color)
+            value_surf = _render_cached(self.font_stat_value, value, title_color)
 
             # --- FIX: Value on the left, label right-aligned as requested ---
-            screen.blit(value_surf, (self.rect.x + padding, current_y))
-            label_rect = label_surf.get_rect(
-                topright=(self.rect.right - padding, current_y)
-            )
-            screen.blit(label_surf, label_rect)
+            surface.blit(value_surf, (rect.x + padding, current_y))
+            label_rect = label_surf.get_rect(topright=(rect.right - padding, current_y))
+            surface.blit(label_surf, label_rect)
             current_y += 18
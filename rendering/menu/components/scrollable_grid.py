@@ -1,7 +1,9 @@
 # rendering/menu/components/scrollable_grid.py
 import pygame
 import logging
-from typing import Tuple, Dict, Any
+from typing import Iterator, Tuple, Dict, Any, Optional
+
+from rendering.common.panels.panel_utils import to_display_format
 
 logger = logging.getLogger(__name__)
 
@@ -45,12 +47,33 @@ class ScrollableGrid:
         self.max_scroll = 0
         self.is_scrollable = False
 
+        self._compute_layout_constants()
+
+        # The scrollbar track never changes for a given area, so it is
+        # rasterized once on first use.
+        self._track_surf: Optional[pygame.Surface] = None
+        # Scrollbar geometry, recomputed only when the scroll offset or the
+        # content height it was derived from changes.
+        self._scrollbar_key: Optional[Tuple[int, int]] = None
+        self._track_rect = pygame.Rect(0, 0, 0, 0)
+        self._handle_rect = pygame.Rect(0, 0, 0, 0)
+
+    def _compute_layout_constants(self):
+        """Caches the layout values shared by every item position."""
+        self._col_stride = self.item_width + self.spacing_x
+        self._row_stride = self.item_height + self.spacing_y
+        total_grid_width = (self.columns * self.item_width) + (
+            max(0, self.columns - 1) * self.spacing_x
+        )
+        self._start_x = self.area.x + (self.area.width - total_grid_width) // 2
+
     def update_item_count(self, num_items: int):
         """
         Recalculates the grid's total height and scrolling parameters.
         """
         if self.columns <= 0:
             return
+        self._compute_layout_constants()
 
         num_rows = (num_items + self.columns - 1) // self.columns
         self.content_height = (num_rows * self.item_height) + (
@@ -65,23 +88,79 @@ class ScrollableGrid:
         """
         Calculates the layout position for an item at a given index.
         """
-        col = index % self.columns
-        row = index // self.columns
-
-        total_grid_width = (self.columns * self.item_width) + (
-            max(0, self.columns - 1) * self.spacing_x
-        )
-        start_x = self.area.x + (self.area.width - total_grid_width) / 2
+        row, col = divmod(index, self.columns)
 
-        x_pos = start_x + col * (self.item_width + self.spacing_x)
-        y_pos = self.area.y + row * (self.item_height + self.spacing_y)
+        x_pos = self._start_x + col * self._col_stride
+        y_pos = self.area.y + row * self._row_stride
 
         return pygame.Rect(x_pos, y_pos, self.item_width, self.item_height)
 
+    def get_visible_range(self, num_items: int) -> range:
+        """
+        Returns the indices of the items whose rows overlap the visible area
+        at the current scroll offset, so callers only lay out and draw those.
+        """
+        if self.columns <= 0 or self._row_stride <= 0:
+            return range(0)
+        # A row r is visible when its top is above the area's bottom edge and
+        # its bottom is below the top edge (after scrolling).
+        first_row = max(0, (self.scroll_y - self.item_height) // self._row_stride + 1)
+        end_row = -(-(self.scroll_y + self.area.height) // self._row_stride)
+        return range(
+            min(num_items, int(first_row) * self.columns),
+            min(num_items, int(end_row) * self.columns),
+        )
+
+    def iter_visible(self, num_items: int) -> Iterator[Tuple[int, Tuple[int, int]]]:
+        """
+        Yields (index, top-left) for every visible item, with the scroll
+        offset already applied. Positions are stepped along the grid instead
+        of building a layout rect per item and testing it against the area.
+        """
+        visible = self.get_visible_range(num_items)
+        if not visible:
+            return
+        row, col = divmod(visible.start, self.columns)
+        x = self._start_x + col * self._col_stride
+        y = self.area.y + row * self._row_stride - self.scroll_y
+        for index in visible:
+            yield index, (x, y)
+            col += 1
+            if col == self.columns:
+                col = 0
+                x = self._start_x
+                y += self._row_stride
+            else:
+                x += self._col_stride
+
+    def get_index_at(self, pos: Tuple[int, int], num_items: int) -> Optional[int]:
+        """
+        Returns the index of the visible item under an on-screen position, or
+        None. The grid is inverted arithmetically, so only the single
+        candidate item's rect is tested.
+        """
+        pitch_x = self._col_stride
+        pitch_y = self._row_stride
+        if self.columns <= 0 or pitch_x <= 0 or pitch_y <= 0:
+            return None
+
+        col = int((pos[0] - self._start_x) // pitch_x)
+        row = int((pos[1] + self.scroll_y - self.area.y) // pitch_y)
+        if not 0 <= col < self.columns or row < 0:
+            return None
+        index = row * self.columns + col
+        if index >= num_items:
+            return None
+
+        rect = self.get_item_rect(index).move(0, -self.scroll_y)
+        if self.area.colliderect(rect) and rect.collidepoint(pos):
+            return index
+        return None
+
     def handle_scroll_event(self, event: pygame.event.Event):
         """Processes mouse wheel events to update the scroll offset."""
         if self.is_scrollable and event.type == pygame.MOUSEBUTTONDOWN:
-            if self.area.collidepoint(pygame.mouse.get_pos()):
+            if self.area.collidepoint(event.pos):
                 if event.button == 4:  # Scroll up
                     self.scroll_y = max(0, self.scroll_y - 40)
                 elif event.button == 5:  # Scroll down
@@ -95,10 +174,34 @@ class ScrollableGrid:
         # --- NEW: Use theme for styling ---
         track_color = self.colors.get("scrollbar_track", (30, 35, 45))
         handle_color = self.colors.get("scrollbar_handle", (80, 90, 100))
-        track_width = self.layout.get("scrollbar_width", 10)
         border_radius = self.layout.get("border_radius_small", 5)
 
-        track_rect = pygame.Rect(
+        key = (self.scroll_y, self.content_height)
+        if key != self._scrollbar_key:
+            self._update_scrollbar_rects()
+            self._scrollbar_key = key
+        track_rect = self._track_rect
+
+        if self._track_surf is None or self._track_surf.get_size() != track_rect.size:
+            track_surf = pygame.Surface(track_rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(
+                track_surf,
+                track_color,
+                track_surf.get_rect(),
+                border_radius=border_radius,
+            )
+            self._track_surf = to_display_format(track_surf)
+        screen.blit(self._track_surf, track_rect)
+        pygame.draw.rect(
+            screen, handle_color, self._handle_rect, border_radius=border_radius
+        )
+
+    def _update_scrollbar_rects(self):
+        """Recomputes the scrollbar track and handle for the current scroll."""
+        # Both rects are updated in place rather than reallocated.
+        track_width = self.layout.get("scrollbar_width", 10)
+        track_rect = self._track_rect
+        track_rect.update(
             self.area.right + 5, self.area.top, track_width, self.area.height
         )
         handle_height = self.area.height * (self.area.height / self.content_height)
@@ -106,9 +209,7 @@ class ScrollableGrid:
 
         scroll_ratio = self.scroll_y / self.max_scroll if self.max_scroll > 0 else 0
         handle_y = track_rect.y + (track_rect.height - handle_height) * scroll_ratio
-        handle_rect = pygame.Rect(
+        handle_height, handle_y = int(handle_height), int(handle_y)
+        self._handle_rect.update(
             track_rect.x, handle_y, track_rect.width, handle_height
         )
-
-        pygame.draw.rect(screen, track_color, track_rect, border_radius=border_radius)
-        pygame.draw.rect(screen, handle_color, handle_rect, border_radius=border_radius)
@@ -1,10 +1,12 @@
 # rendering/menu/menu_manager.py
 import pygame
 import logging
-from typing import Optional, List, Dict, Any, Callable, TYPE_CHECKING
+from typing import Optional, List, Dict, Any, Callable, Tuple, TYPE_CHECKING
 from enum import Enum, auto
 
 from ..common.ui.ui_element import UIElement
+from ..common.ui.ui_events import POSITIONAL_EVENT_TYPES
+from ..common.panels.panel_utils import blit_sequence, to_display_format
 from .screens.level_selection_screen import LevelSelectionScreen
 from .screens.workshop_screen import WorkshopScreen
 
@@ -15,6 +17,10 @@ if TYPE_CHECKING:
 MenuAction = Callable[[], None]
 logger = logging.getLogger(__name__)
 
+# Partial display updates only beat a full flip for a handful of small rects;
+# past this many dirty rects the main menu is simply redrawn in full.
+_MAX_PARTIAL_UPDATE_RECTS = 3
+
 
 class MenuState(Enum):
     MAIN = auto()
@@ -43,58 +49,61 @@ class MenuButton(UIElement):
         self.layout = ui_theme.get("layout", {})
         self.font = font_manager.get_font("button_large")
 
-    def handle_event(self, event: pygame.event.Event) -> bool:
-        """Handles mouse events for the button. If clicked, it executes its action."""
-        # --- FIX (Step 1.1): Prevent crash on non-mouse events & fix stale hover state ---
-        # This handler now robustly processes only mouse events by checking the event type.
-        # This prevents crashes when keyboard events are passed to this handler.
-        if event.type == pygame.MOUSEMOTION:
-            self.is_hovered = self.rect.collidepoint(event.pos)
-            return False  # A hover event is never "handled" in a way that stops propagation
-
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            # We check the position directly on click, which is the most reliable way.
-            if self.rect.collidepoint(event.pos):
-                self.action()
-                return True  # The click was handled by this button.
-
-        return False
+        # The label never changes, so it is rendered once rather than per frame.
+        self._text_surf = self.font.render(
+            self.text, True, self.colors.get("text_primary")
+        )
+        self._text_rect = self._text_surf.get_rect(center=self.rect.center)
+        # The button only has two looks, idle and hovered, so both are
+        # composited (background, border and label) up front.
+        self._surfs = {
+            False: self._render_state(False),
+            True: self._render_state(True),
+        }
 
-    def draw(self, screen: pygame.Surface):
-        """Draws the button to the screen using theme styles."""
+    def _render_state(self, is_hovered: bool) -> pygame.Surface:
+        """Rasterizes the complete button for one hover state."""
         bg_color = (
             self.colors.get("panel_interactive_hover")
-            if self.is_hovered
+            if is_hovered
             else self.colors.get("panel_secondary")
         )
         border_color = (
             self.colors.get("border_interactive_selected")
-            if self.is_hovered
+            if is_hovered
             else self.colors.get("border_primary")
         )
         border_width = (
             self.layout.get("border_width_selected")
-            if self.is_hovered
+            if is_hovered
             else self.layout.get("border_width_standard")
         )
 
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        rect = surface.get_rect()
         pygame.draw.rect(
-            screen,
+            surface,
             bg_color,
-            self.rect,
+            rect,
             border_radius=self.layout.get("border_radius_large"),
         )
         pygame.draw.rect(
-            screen,
+            surface,
             border_color,
-            self.rect,
+            rect,
             border_width,
             border_radius=self.layout.get("border_radius_large"),
         )
+        surface.blit(self._text_surf, self._text_rect.move(-self.rect.x, -self.rect.y))
+        return to_display_format(surface)
+
+    def render(self) -> Tuple[pygame.Surface, pygame.Rect]:
+        """Returns the button's surface for its current state and where it goes."""
+        return self._surfs[self.is_hovered], self.rect
 
-        text_surf = self.font.render(self.text, True, self.colors.get("text_primary"))
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        screen.blit(text_surf, text_rect)
+    def draw(self, screen: pygame.Surface):
+        """Draws the button to the screen using theme styles."""
+        screen.blit(*self.render())
 
 
 class MenuManager:
@@ -121,11 +130,28 @@ class MenuManager:
         self.quit_callback = quit_callback
 
         self.state = MenuState.MAIN
+        # Event and draw handlers of the active screen, swapped on every state
+        # change so per-event dispatch is a single call.
+        self._active_handler: Callable[[pygame.event.Event], bool] = (
+            self._handle_main_menu_event
+        )
+        self._active_drawer: Callable[[pygame.Surface], None] = self._draw_main_menu
         self._load_theme_assets()
 
         self.main_menu_buttons: List[MenuButton] = []
+        # The main menu is static apart from button hover, so after one full
+        # draw only the buttons whose hover changed need repainting.
+        self._needs_full_redraw = True
+        self._dirty_rects: List[pygame.Rect] = []
+        # Column geometry of the main menu buttons as (left, right, top, step,
+        # button_height), used to find the hovered button without a scan.
+        self._button_column = (0, 0, 0, 1, 0)
+        self._hovered_index: Optional[int] = None
         self.level_selection_screen: Optional[LevelSelectionScreen] = None
         self.workshop_screen: Optional[WorkshopScreen] = None
+        # Progression state the cached workshop was built from; the screen is
+        # only rebuilt when currency or tower unlocks have changed since.
+        self._workshop_cache_key: Optional[Tuple[int, frozenset]] = None
 
         self.rebuild_all_screens()
         logger.info("MenuManager initialized and configured with UI theme.")
@@ -135,14 +161,29 @@ class MenuManager:
         self.colors = self.ui_theme.get("colors", {})
         self.layout = self.ui_theme.get("layout", {})
         self.font_title = self.font_manager.get_font("title_large")
+        self.title_surf = to_display_format(
+            self.font_title.render(
+                "ChaosDefense", True, self.colors.get("text_primary")
+            )
+        )
+        self.title_rect = self.title_surf.get_rect()
 
     def on_resize(self, new_screen_rect: pygame.Rect):
         """Handles window resizing by rebuilding all screens."""
         self.screen_rect = new_screen_rect
         self.rebuild_all_screens()
 
+    def invalidate(self):
+        """Forces the next frame to redraw the active screen in full."""
+        self._needs_full_redraw = True
+        self._dirty_rects.clear()
+
     def rebuild_all_screens(self):
-        """Re-creates all menu buttons and screen instances."""
+        """
+        Rebuilds the main menu and re-shows the active sub-screen, which is
+        reused or only rebuilt when its layout changed.
+        """
+        self.invalidate()
         self._build_main_menu()
         if self.state == MenuState.LEVEL_SELECT:
             self._show_level_select()
@@ -151,37 +192,76 @@ class MenuManager:
 
     def _show_main_menu(self):
         self.state = MenuState.MAIN
+        self._active_handler = self._handle_main_menu_event
+        self._active_drawer = self._draw_main_menu
+        self.invalidate()
 
     def _show_level_select(self):
         player_data = self.progression_manager.get_player_data()
-        self.level_selection_screen = LevelSelectionScreen(
-            screen_rect=self.screen_rect,
-            level_configs=self.all_configs["level_styles"],
-            unlocked_levels=player_data.unlocked_levels,
-            ui_theme=self.ui_theme,
-            font_manager=self.font_manager,
-            start_level_callback=self.start_level_callback,
-            back_callback=self._show_main_menu,
-        )
+        screen = self.level_selection_screen
+        if screen is not None and screen.screen_rect == self.screen_rect:
+            # Same layout as before: only lock states can have changed.
+            screen.reset(player_data.unlocked_levels)
+        else:
+            screen = LevelSelectionScreen(
+                screen_rect=self.screen_rect,
+                level_configs=self.all_configs["level_styles"],
+                unlocked_levels=player_data.unlocked_levels,
+                ui_theme=self.ui_theme,
+                font_manager=self.font_manager,
+                start_level_callback=self.start_level_callback,
+                back_callback=self._show_main_menu,
+            )
+            self.level_selection_screen = screen
         self.state = MenuState.LEVEL_SELECT
+        self._active_handler = self._handle_screen_event(screen)
+        self._active_drawer = screen.draw
 
     def _show_workshop(self):
-        self.workshop_screen = WorkshopScreen(
-            screen_rect=self.screen_rect,
-            progression_manager=self.progression_manager,
-            ui_theme=self.ui_theme,
-            font_manager=self.font_manager,
-            back_callback=self._show_main_menu,
-        )
+        player_data = self.progression_manager.get_player_data()
+        key = (player_data.meta_currency, frozenset(player_data.unlocked_towers))
+        screen = self.workshop_screen
+        if (
+            screen is not None
+            and screen.screen_rect == self.screen_rect
+            and self._workshop_cache_key == key
+        ):
+            # Nothing the layout depends on changed; just clear leftover state.
+            screen.reset()
+        else:
+            screen = WorkshopScreen(
+                screen_rect=self.screen_rect,
+                progression_manager=self.progression_manager,
+                ui_theme=self.ui_theme,
+                font_manager=self.font_manager,
+                back_callback=self._show_main_menu,
+            )
+            self.workshop_screen = screen
+            self._workshop_cache_key = key
         self.state = MenuState.WORKSHOP
+        self._active_handler = self._handle_screen_event(screen)
+        self._active_drawer = screen.draw
+
+    @staticmethod
+    def _handle_screen_event(screen) -> Callable[[pygame.event.Event], bool]:
+        """Wraps a sub-screen's handler; a sub-screen consumes every event."""
+
+        def handler(event: pygame.event.Event) -> bool:
+            screen.handle_event(event)
+            return True
+
+        return handler
 
     def _build_main_menu(self):
         """Creates and positions all buttons for the main menu screen."""
         self.main_menu_buttons.clear()
+        self.title_rect = self.title_surf.get_rect(
+            centerx=self.screen_rect.centerx, y=self.screen_rect.height * 0.2
+        )
         button_width, button_height = 300, 60
         button_spacing = self.layout.get("spacing_large", 20)
         total_button_height = (button_height * 3) + (button_spacing * 2)
-        start_y = self.screen_rect.centery - (total_button_height / 2) + 50
+        start_y = self.screen_rect.centery - (total_button_height // 2) + 50
 
         button_actions = {
             "Play": self._show_level_select,
@@ -191,7 +271,7 @@ class MenuManager:
 
         for i, (text, action) in enumerate(button_actions.items()):
             button_rect = pygame.Rect(
-                self.screen_rect.centerx - button_width / 2,
+                self.screen_rect.centerx - button_width // 2,
                 start_y + i * (button_height + button_spacing),
                 button_width,
                 button_height,
@@ -200,41 +280,107 @@ class MenuManager:
                 MenuButton(button_rect, text, action, self.ui_theme, self.font_manager)
             )
 
+        first_rect = self.main_menu_buttons[0].rect
+        self._button_column = (
+            first_rect.left,
+            first_rect.right,
+            first_rect.top,
+            button_height + button_spacing,
+            button_height,
+        )
+        self._hovered_index = None
+
+    def _main_menu_index_at(self, pos) -> Optional[int]:
+        """Returns the index of the main menu button under pos, or None."""
+        left, right, top, step, height = self._button_column
+        x, y = pos
+        if not left <= x < right or y < top:
+            return None
+        index, offset = divmod(int(y - top), step)
+        if index < len(self.main_menu_buttons) and offset < height:
+            return index
+        return None
+
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Delegates events to the currently active screen."""
-        if self.state == MenuState.MAIN:
-            for button in self.main_menu_buttons:
-                if button.handle_event(event):
-                    return True
-        elif self.state == MenuState.LEVEL_SELECT and self.level_selection_screen:
-            self.level_selection_screen.handle_event(event)
-            return True
-        elif self.state == MenuState.WORKSHOP and self.workshop_screen:
-            self.workshop_screen.handle_event(event)
-            return True
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            # The window contents were lost, so partial updates aren't enough.
+            self.invalidate()
+
+        if event.type not in POSITIONAL_EVENT_TYPES:
+            return False
+        if event.type == pygame.MOUSEMOTION and event.rel == (0, 0):
+            return False  # The cursor didn't move, so no hover state can change.
+        return self._active_handler(event)
+
+    def _handle_main_menu_event(self, event: pygame.event.Event) -> bool:
+        if event.type == pygame.MOUSEMOTION:
+            # The buttons form a single column, so the hovered one is
+            # found arithmetically rather than by testing every button.
+            index = self._main_menu_index_at(event.pos)
+            if index != self._hovered_index:
+                for changed in (self._hovered_index, index):
+                    if changed is not None:
+                        button = self.main_menu_buttons[changed]
+                        button.is_hovered = changed == index
+                        self._dirty_rects.append(button.rect)
+                self._hovered_index = index
+            return False
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            # Clicks use the same column lookup instead of asking each button.
+            index = self._main_menu_index_at(event.pos)
+            if index is not None:
+                self.main_menu_buttons[index].action()
+                return True
         return False
 
     def update(self, dt: float):
         pass
 
+    def draw_updates(
+        self, screen: pygame.Surface, background_color
+    ) -> Optional[List[pygame.Rect]]:
+        """
+        Repaints only what changed on the main menu since the last frame.
+
+        Returns the screen areas that were repainted (empty if nothing
+        changed) for a partial display update, or None if the active screen
+        needs a full draw() and flip instead.
+        """
+        if (
+            self.state != MenuState.MAIN
+            or self._needs_full_redraw
+            or len(self._dirty_rects) > _MAX_PARTIAL_UPDATE_RECTS
+        ):
+            return None
+
+        dirty = self._dirty_rects
+        self._dirty_rects = []
+        for rect in dirty:
+            screen.fill(background_color, rect)
+        blit_sequence(
+            screen,
+            [
+                button.render()
+                for button in self.main_menu_buttons
+                if button.rect.collidelist(dirty) != -1
+            ],
+        )
+        return dirty
+
     def draw(self, screen: pygame.Surface):
         """Draws the currently active screen."""
-        if self.state == MenuState.MAIN:
-            self._draw_main_menu(screen)
-        elif self.state == MenuState.LEVEL_SELECT and self.level_selection_screen:
-            self.level_selection_screen.draw(screen)
-        elif self.state == MenuState.WORKSHOP and self.workshop_screen:
-            self.workshop_screen.draw(screen)
+        self._active_drawer(screen)
+        # A full main menu draw is the baseline for later partial updates;
+        # any other screen leaves the main menu needing a full redraw.
+        self._needs_full_redraw = self.state != MenuState.MAIN
+        self._dirty_rects.clear()
 
     def _draw_main_menu(self, screen: pygame.Surface):
         """Draws the main title and buttons using theme styles."""
-        title_surf = self.font_title.render(
-            "ChaosDefense", True, self.colors.get("text_primary")
-        )
-        title_rect = title_surf.get_rect(
-            centerx=self.screen_rect.centerx, y=self.screen_rect.height * 0.2
+        # The title and every button go to SDL in a single call.
+        blit_sequence(
+            screen,
+            [(self.title_surf, self.title_rect)]
+            + [button.render() for button in self.main_menu_buttons],
         )
-        screen.blit(title_surf, title_rect)
-
-        for button in self.main_menu_buttons:
-            button.draw(screen)
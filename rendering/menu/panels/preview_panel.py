@@ -1,11 +1,17 @@
 # rendering/menu/panels/preview_panel.py
 import pygame
+import inspect
 import logging
-from typing import Dict, Any, Optional, Callable, TYPE_CHECKING
+from typing import Dict, Any, List, Optional, Callable, Tuple, TYPE_CHECKING
 
 from rendering.common.ui.ui_element import UIElement
 from rendering.text.text_renderer import render_text_wrapped
-from rendering.common.panels.panel_utils import get_nested_value, format_stat_value
+from rendering.common.panels.panel_utils import (
+    get_nested_value,
+    format_stat_value,
+    blit_sequence,
+    to_display_format,
+)
 
 if TYPE_CHECKING:
     from rendering.text.font_manager import FontManager
@@ -41,7 +47,15 @@ class PreviewPanel(UIElement):
         self.active_item_data: Optional[Dict[str, Any]] = None
         self.action_button: Optional[UIElement] = None
         self.action_callback: Optional[Callable] = None
+        self._callback_needs_id = False
         self.is_button_enabled = False
+        # The active item's content, rendered once per item in set_item()
+        # so that draw() only has to blit it.
+        self._desc_lines: List[pygame.Surface] = []
+        self._title_surf: Optional[pygame.Surface] = None
+        self._stat_surfs: List[Tuple[pygame.Surface, pygame.Surface]] = []
+        self._button_text_surf: Optional[pygame.Surface] = None
+        self._panel_surf: Optional[pygame.Surface] = None
 
         self._load_theme_assets()
 
@@ -56,6 +70,22 @@ class PreviewPanel(UIElement):
         self.font_stat_label = self.font_manager.get_font("body_tiny")
         self.font_stat_value = self.font_manager.get_font("body_tiny_bold")
         self.font_button = self.font_manager.get_font("button_large")
+        self._stat_header_surf = to_display_format(
+            self.font_stat_header.render(
+                "Statistics", True, self.colors.get("text_primary")
+            )
+        )
+
+        # Style values used every frame are resolved once here rather than
+        # looked up in the theme dicts on each draw.
+        self._padding = self.layout.get("padding_large", 20)
+        self._spacing = self.layout.get("spacing_medium", 10)
+        self._border_radius = self.layout.get("border_radius_large", 8)
+        self._border_width = self.layout.get("border_width_standard", 2)
+        self._border_color = self.colors.get("border_primary", (80, 90, 100))
+        self._button_bg = self.colors.get("button_primary_bg")
+        self._button_bg_hover = self.colors.get("button_primary_hover")
+        self._button_bg_disabled = self.colors.get("button_disabled_bg")
 
     def set_item(
         self,
@@ -70,6 +100,7 @@ class PreviewPanel(UIElement):
         """
         self.active_item_data = item_data
         self.action_callback = button_action
+        self._callback_needs_id = self._takes_item_id(button_action)
         self.is_button_enabled = is_button_enabled
 
         if item_data:
@@ -84,13 +115,89 @@ class PreviewPanel(UIElement):
             )
             self.action_button = UIElement(button_rect)
             self.action_button.text = button_text
+            self._render_content()
         else:
             self.action_button = None
             self.rect.height = 0  # Collapse panel if no item
 
+    @staticmethod
+    def _takes_item_id(callback: Optional[Callable]) -> bool:
+        """
+        Whether the callback expects the item id as a positional argument.
+        The workshop screen passes a lambda with no args, level select
+        passes a callback that takes the level id.
+        """
+        if callback is None:
+            return False
+        try:
+            parameters = inspect.signature(callback).parameters.values()
+        except (TypeError, ValueError):
+            return False
+        return any(
+            p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+            and p.default is p.empty
+            for p in parameters
+        )
+
+    def _render_content(self):
+        """Renders the active item's title, stats and button label."""
+        item_data = self.active_item_data
+        # Every cached text surface is converted to the display format so
+        # the per-frame blits take SDL's fast path.
+        self._title_surf = to_display_format(
+            self.font_title.render(
+                item_data.get("name", "No Item Selected"),
+                True,
+                self.colors.get("text_primary", (240, 240, 240)),
+            )
+        )
+
+        self._stat_surfs = []
+        for stat_info in item_data.get("info_panel_stats", []):
+            label = stat_info.get("label", "N/A")
+            value_path = stat_info.get("value_path")
+            value = get_nested_value(item_data, value_path) if value_path else "N/A"
+
+            if value is None:
+                continue
+
+            value_str = format_stat_value(value, stat_info.get("format"))
+            label_surf = self.font_stat_label.render(
+                f"{label}:", True, self.colors.get("text_secondary")
+            )
+            value_surf = self.font_stat_value.render(
+                value_str, True, self.colors.get("text_primary")
+            )
+            self._stat_surfs.append(
+                (to_display_format(label_surf), to_display_format(value_surf))
+            )
+
+        # The label only changes color when the button is disabled; hovering
+        # just swaps the background.
+        text_color = (
+            self.colors.get("text_primary")
+            if self.is_button_enabled
+            else self.colors.get("text_disabled")
+        )
+        self._button_text_surf = to_display_format(
+            self.font_button.render(self.action_button.text, True, text_color)
+        )
+
+        # The background is a single flat color, so it uses per-surface alpha
+        # on an opaque, display-format surface instead of per-pixel alpha.
+        if self._panel_surf is None or self._panel_surf.get_size() != self.rect.size:
+            self._panel_surf = pygame.Surface(self.rect.size)
+            try:
+                self._panel_surf = self._panel_surf.convert()
+            except pygame.error:
+                pass  # No display mode set yet; keep the plain surface.
+            self._panel_surf.fill(self.colors.get("panel_primary", [25, 30, 40]))
+            self._panel_surf.set_alpha(230)
+
     def _calculate_dynamic_height(self):
         """Calculates the panel's total height based on its content."""
         if not self.active_item_data:
+            self._desc_lines = []
             self.rect.height = 0
             return
 
@@ -104,10 +211,16 @@ class PreviewPanel(UIElement):
         # Description
         desc = self.active_item_data.get("description", "")
         desc_max_width = self.rect.width - (padding * 2)
-        wrapped_desc = render_text_wrapped(
-            desc, self.font_desc, self.colors.get("text_secondary"), desc_max_width
-        )
-        current_y += sum(line.get_height() for line in wrapped_desc) + padding
+        self._desc_lines = [
+            to_display_format(line)
+            for line in render_text_wrapped(
+                desc,
+                self.font_desc,
+                self.colors.get("text_secondary", (180, 180, 190)),
+                desc_max_width,
+            )
+        ]
+        current_y += sum(line.get_height() for line in self._desc_lines) + padding
 
         # Stats
         stats_to_display = self.active_item_data.get("info_panel_stats", [])
@@ -137,11 +250,10 @@ class PreviewPanel(UIElement):
             and self.action_button.rect.collidepoint(event.pos)
         ):
             if self.action_callback:
-                # The workshop screen passes a lambda with no args, level select passes one with an ID.
-                # This try/except handles both cases gracefully.
-                try:
+                # The callback's arity was checked once in set_item().
+                if not self._callback_needs_id:
                     self.action_callback()
-                except TypeError:
+                else:
                     item_id = (
                         self.active_item_data.get("id")
                         if self.active_item_data
@@ -156,109 +268,65 @@ class PreviewPanel(UIElement):
             return
 
         # Draw panel background and border
-        panel_surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-
-        # --- FIX (Step 1.2): Convert list-based color to tuple before concatenation ---
-        # The color is loaded from JSON as a list. We must cast it to a tuple
-        # before we can add the alpha tuple `(230,)` to it. This resolves the TypeError.
-        bg_color_list = self.colors.get("panel_primary", [25, 30, 40])
-        panel_surf.fill(tuple(bg_color_list) + (230,))
-        screen.blit(panel_surf, self.rect.topleft)
+        screen.blit(self._panel_surf, self.rect.topleft)
 
         pygame.draw.rect(
             screen,
-            self.colors.get("border_primary", (80, 90, 100)),
+            self._border_color,
             self.rect,
-            self.layout.get("border_width_standard", 2),
-            border_radius=self.layout.get("border_radius_large", 8),
+            self._border_width,
+            border_radius=self._border_radius,
         )
 
-        padding = self.layout.get("padding_large", 20)
-        spacing = self.layout.get("spacing_medium", 10)
+        padding = self._padding
+        spacing = self._spacing
+        left = self.rect.x + padding
         current_y = self.rect.y + padding
 
+        # Action Button background; its label joins the text blits below.
+        if self.action_button:
+            if not self.is_button_enabled:
+                bg_color = self._button_bg_disabled
+            elif self.action_button.is_hovered:
+                bg_color = self._button_bg_hover
+            else:
+                bg_color = self._button_bg
+
+            pygame.draw.rect(
+                screen,
+                bg_color,
+                self.action_button.rect,
+                border_radius=self._border_radius,
+            )
+
+        # All text is collected top to bottom and sent to SDL in one call.
         # Title
-        title_surf = self.font_title.render(
-            self.active_item_data.get("name", "No Item Selected"),
-            True,
-            self.colors.get("text_primary", (240, 240, 240)),
-        )
-        screen.blit(title_surf, (self.rect.x + padding, current_y))
-        current_y += title_surf.get_height() + spacing
+        blits = [(self._title_surf, (left, current_y))]
+        current_y += self._title_surf.get_height() + spacing
 
-        # Description
-        desc = self.active_item_data.get("description", "")
-        desc_max_width = self.rect.width - (padding * 2)
-        wrapped_desc = render_text_wrapped(
-            desc,
-            self.font_desc,
-            self.colors.get("text_secondary", (180, 180, 190)),
-            desc_max_width,
-        )
-        for line_surf in wrapped_desc:
-            screen.blit(line_surf, (self.rect.x + padding, current_y))
+        # Description (wrapped when the item was set)
+        for line_surf in self._desc_lines:
+            blits.append((line_surf, (left, current_y)))
             current_y += line_surf.get_height()
         current_y += padding
 
         # Stats
-        stats_to_display = self.active_item_data.get("info_panel_stats", [])
-        if stats_to_display:
-            header_surf = self.font_stat_header.render(
-                "Statistics", True, self.colors.get("text_primary")
-            )
-            screen.blit(header_surf, (self.rect.x + padding, current_y))
-            current_y += header_surf.get_height() + spacing
-
-            for stat_info in stats_to_display:
-                label = stat_info.get("label", "N/A")
-                value_path = stat_info.get("value_path")
-                value = (
-                    get_nested_value(self.active_item_data, value_path)
-                    if value_path
-                    else "N/A"
-                )
-
-                if value is None:
-                    continue
+        if self.active_item_data.get("info_panel_stats"):
+            blits.append((self._stat_header_surf, (left, current_y)))
+            current_y += self._stat_header_surf.get_height() + spacing
 
-                value_str = format_stat_value(value, stat_info.get("format"))
-                label_surf = self.font_stat_label.render(
-                    f"{label}:", True, self.colors.get("text_secondary")
-                )
-                value_surf = self.font_stat_value.render(
-                    value_str, True, self.colors.get("text_primary")
-                )
-
-                # --- FIX: Corrected typo from 'currenty' to 'current_y' ---
-                screen.blit(label_surf, (self.rect.x + padding, current_y))
+            for label_surf, value_surf in self._stat_surfs:
+                blits.append((label_surf, (left, current_y)))
                 value_rect = value_surf.get_rect(
                     topright=(self.rect.right - padding, current_y)
                 )
-                screen.blit(value_surf, value_rect)
+                blits.append((value_surf, value_rect))
                 current_y += 22
 
-        # Action Button
         if self.action_button:
-            if not self.is_button_enabled:
-                bg_color = self.colors.get("button_disabled_bg")
-                text_color = self.colors.get("text_disabled")
-            elif self.action_button.is_hovered:
-                bg_color = self.colors.get("button_primary_hover")
-                text_color = self.colors.get("text_primary")
-            else:
-                bg_color = self.colors.get("button_primary_bg")
-                text_color = self.colors.get("text_primary")
-
-            pygame.draw.rect(
-                screen,
-                bg_color,
-                self.action_button.rect,
-                border_radius=self.layout.get("border_radius_large", 8),
-            )
-            button_text_surf = self.font_button.render(
-                self.action_button.text, True, text_color
-            )
-            button_text_rect = button_text_surf.get_rect(
+            button_text_rect = self._button_text_surf.get_rect(
                 center=self.action_button.rect.center
             )
-            screen.blit(button_text_surf, button_text_rect)
+            blits.append((self._button_text_surf, button_text_rect))
+
+        blit_sequence(screen, blits)
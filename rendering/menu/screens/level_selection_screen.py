@@ -4,6 +4,7 @@ import logging
 from typing import List, Dict, Any, Callable, Set, Optional, TYPE_CHECKING
 
 from rendering.common.ui.ui_element import UIElement
+from rendering.common.panels.panel_utils import to_display_format
 from ..components.scrollable_grid import ScrollableGrid
 from ..panels.preview_panel import PreviewPanel
 from ..buttons.list_item_button import ListItemButton
@@ -35,6 +36,8 @@ class LevelSelectionScreen:
         self.level_configs = {
             k: v for k, v in level_configs.items() if isinstance(v, dict)
         }
+        # Materialized once; the level list never changes for this screen.
+        self._level_items = list(self.level_configs.items())
         self.unlocked_levels = unlocked_levels
         self.ui_theme = ui_theme
         self.font_manager = font_manager
@@ -43,10 +46,11 @@ class LevelSelectionScreen:
 
         self.buttons: List[ListItemButton] = []
         self.selected_button: Optional[ListItemButton] = None
+        self._hovered_index: Optional[int] = None
 
         self._load_theme_assets()
         self._setup_components()
-        self._build_layout()
+        self._build_static_layout()
 
     def _load_theme_assets(self):
         """Loads styles and fonts needed for the screen itself."""
@@ -54,12 +58,21 @@ class LevelSelectionScreen:
         self.layout = self.ui_theme.get("layout", {})
         self.font_title = self.font_manager.get_font("title_medium")
         self.font_back_button = self.font_manager.get_font("button_large")
+        # Static labels are rendered once instead of every frame.
+        self.title_surf = to_display_format(
+            self.font_title.render(
+                "Select Mission", True, self.colors.get("text_primary")
+            )
+        )
+        self.back_text_surf = to_display_format(
+            self.font_back_button.render("Back", True, self.colors.get("text_primary"))
+        )
 
     def _setup_components(self):
         """Initializes the core UI components like the grid and preview panel."""
         padding = self.layout.get("padding_large", 20)
-        grid_area_width = self.screen_rect.width * 0.5
-        preview_area_width = self.screen_rect.width * 0.4
+        grid_area_width = self.screen_rect.width // 2
+        preview_area_width = self.screen_rect.width * 2 // 5
         grid_area = pygame.Rect(
             padding * 2, 120, grid_area_width, self.screen_rect.height - 200
         )
@@ -67,12 +80,12 @@ class LevelSelectionScreen:
             grid_area.right + padding * 2,
             120,
             preview_area_width,
-            self.screen_rect.height * 0.7,
+            self.screen_rect.height * 7 // 10,
         )
 
         self.grid = ScrollableGrid(
             area=grid_area,
-            item_size=(int(grid_area.width * 0.9), 80),
+            item_size=(grid_area.width * 9 // 10, 80),
             item_spacing=(padding, padding),
             columns=1,
             ui_theme=self.ui_theme,
@@ -84,11 +97,39 @@ class LevelSelectionScreen:
 
         back_button_rect = pygame.Rect(padding, self.screen_rect.bottom - 80, 150, 50)
         self.back_button = UIElement(back_button_rect)
+        self.title_rect = self.title_surf.get_rect(
+            centerx=self.screen_rect.centerx, y=self.screen_rect.height * 0.05
+        )
+        self.back_text_rect = self.back_text_surf.get_rect(
+            center=back_button_rect.center
+        )
+        self._back_bg_surfs = {
+            False: self._render_back_background(self.colors.get("panel_secondary")),
+            True: self._render_back_background(
+                self.colors.get("panel_interactive_hover")
+            ),
+        }
 
-    def _build_layout(self):
-        """Creates the level buttons using the new ListItemButton."""
+    def _render_back_background(self, color) -> pygame.Surface:
+        """Rasterizes the rounded back button background in the given color."""
+        surface = pygame.Surface(self.back_button.rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(
+            surface,
+            color,
+            surface.get_rect(),
+            border_radius=self.layout.get("border_radius_large"),
+        )
+        return to_display_format(surface)
+
+    def _build_static_layout(self):
+        """
+        Creates the level buttons using the new ListItemButton. Their layout
+        only depends on the level list, so this runs once per screen; lock
+        changes go through refresh_locked_state() instead.
+        """
         self.buttons.clear()
-        for level_id, level_data in self.level_configs.items():
+        self._hovered_index = None
+        for i, (level_id, level_data) in enumerate(self._level_items):
             is_locked = level_id not in self.unlocked_levels
 
             button_data = {
@@ -102,7 +143,7 @@ class LevelSelectionScreen:
             }
 
             button = ListItemButton(
-                pygame.Rect(0, 0, 0, 0),
+                self.grid.get_item_rect(i),
                 button_data,
                 self.ui_theme,
                 self.font_manager,
@@ -111,6 +152,27 @@ class LevelSelectionScreen:
 
         self.grid.update_item_count(len(self.buttons))
 
+    def refresh_locked_state(self, unlocked_levels: Set[str]):
+        """Re-applies the lock state, re-rendering only buttons that changed."""
+        self.unlocked_levels = unlocked_levels
+        for button, (level_id, _) in zip(self.buttons, self._level_items):
+            button.set_locked(level_id not in unlocked_levels)
+
+    def reset(self, unlocked_levels: Set[str]):
+        """
+        Returns the screen to its freshly opened state so it can be shown
+        again without being rebuilt.
+        """
+        self.refresh_locked_state(unlocked_levels)
+        self.selected_button = None
+        self._hovered_index = None
+        for button in self.buttons:
+            button.is_selected = False
+            button.is_hovered = False
+        self.back_button.is_hovered = False
+        self.grid.scroll_y = 0
+        self.preview_panel.set_item(None, "", lambda: None)
+
     def handle_event(self, event: pygame.event.Event):
         """
         Handles user input for the level selection screen with a clean,
@@ -125,19 +187,15 @@ class LevelSelectionScreen:
             mouse_pos = event.pos
             self.back_button.is_hovered = self.back_button.rect.collidepoint(mouse_pos)
 
-            for i, button in enumerate(self.buttons):
-                layout_rect = self.grid.get_item_rect(i)
-                on_screen_rect = layout_rect.move(0, -self.grid.scroll_y)
-                # --- FIX: Update the button's internal rect before checking for hover ---
-                button.rect = on_screen_rect
-
-                # --- FIX: Use colliderect instead of contains for more lenient hover detection ---
-                if self.grid.area.colliderect(
-                    on_screen_rect
-                ) and on_screen_rect.collidepoint(mouse_pos):
-                    button.is_hovered = True
-                else:
-                    button.is_hovered = False
+            # Only the button under the cursor (found in O(1) from the grid
+            # layout) and the previously hovered one can change state.
+            index = self.grid.get_index_at(mouse_pos, len(self.buttons))
+            if index != self._hovered_index:
+                if self._hovered_index is not None:
+                    self.buttons[self._hovered_index].is_hovered = False
+                if index is not None:
+                    self.buttons[index].is_hovered = True
+                self._hovered_index = index
 
         # 3. Handle MOUSEBUTTONDOWN for clicks and selections
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -147,18 +205,9 @@ class LevelSelectionScreen:
                 return
 
             clicked_button = None
-            for i, button in enumerate(self.buttons):
-                layout_rect = self.grid.get_item_rect(i)
-                on_screen_rect = layout_rect.move(0, -self.grid.scroll_y)
-                # --- FIX: Update the button's internal rect before checking for clicks ---
-                button.rect = on_screen_rect
-
-                # --- FIX: Use colliderect instead of contains for more lenient click detection ---
-                if self.grid.area.colliderect(
-                    on_screen_rect
-                ) and on_screen_rect.collidepoint(mouse_pos):
-                    clicked_button = button
-                    break
+            index = self.grid.get_index_at(mouse_pos, len(self.buttons))
+            if index is not None:
+                clicked_button = self.buttons[index]
 
             if clicked_button:
                 self.selected_button = clicked_button
@@ -181,45 +230,26 @@ class LevelSelectionScreen:
     def draw(self, screen: pygame.Surface):
         """Draws the entire level selection screen using theme styles."""
         # Title
-        title_surf = self.font_title.render(
-            "Select Mission", True, self.colors.get("text_primary")
-        )
-        title_rect = title_surf.get_rect(
-            centerx=self.screen_rect.centerx, y=self.screen_rect.height * 0.05
-        )
-        screen.blit(title_surf, title_rect)
+        screen.blit(self.title_surf, self.title_rect)
 
         # Back Button
-        back_bg_color = (
-            self.colors.get("panel_interactive_hover")
-            if self.back_button.is_hovered
-            else self.colors.get("panel_secondary")
-        )
-        pygame.draw.rect(
-            screen,
-            back_bg_color,
-            self.back_button.rect,
-            border_radius=self.layout.get("border_radius_large"),
-        )
-        back_text_surf = self.font_back_button.render(
-            "Back", True, self.colors.get("text_primary")
+        screen.blit(
+            self._back_bg_surfs[self.back_button.is_hovered], self.back_button.rect
         )
-        back_text_rect = back_text_surf.get_rect(center=self.back_button.rect.center)
-        screen.blit(back_text_surf, back_text_rect)
+        screen.blit(self.back_text_surf, self.back_text_rect)
 
         # Components
         self.preview_panel.draw(screen)
 
         # Scrollable Content
         screen.set_clip(self.grid.area)
-        for i, button in enumerate(self.buttons):
-            # Calculate final position here, just for drawing
-            layout_rect = self.grid.get_item_rect(i)
+        visible = []
+        for i, topleft in self.grid.iter_visible(len(self.buttons)):
+            button = self.buttons[i]
             # --- FIX: Update the button's internal rect for drawing ---
-            button.rect.topleft = (layout_rect.x, layout_rect.y - self.grid.scroll_y)
-            # --- FIX: Only draw buttons that are at least partially visible ---
-            if self.grid.area.colliderect(button.rect):
-                button.draw(screen)
+            button.rect.topleft = topleft
+            visible.append(button.render())
+        screen.blits(visible, doreturn=False)
         screen.set_clip(None)
 
         self.grid.draw_scrollbar(screen)
@@ -100,6 +100,7 @@ class WorkshopScreen:
         # --- MODIFIED: The list now holds the new, generic button type ---
         self.tower_buttons: List[ListItemButton] = []
         self.selected_tower_button: Optional[ListItemButton] = None
+        self._hovered_index: Optional[int] = None
         self.active_filter = "All"
         self.filter_buttons: List[WorkshopButton] = []
 
@@ -158,7 +159,8 @@ class WorkshopScreen:
             ]
 
         self.tower_buttons.clear()
-        for tower_data in self.filtered_towers_data:
+        self._hovered_index = None
+        for i, tower_data in enumerate(self.filtered_towers_data):
             full_config = all_tower_configs.get(tower_data["id"], {})
             tower_info_full = {**full_config, **tower_data}
 
@@ -194,7 +196,10 @@ class WorkshopScreen:
             }
 
             button = ListItemButton(
-                pygame.Rect(0, 0, 0, 0), button_data, self.ui_theme, self.font_manager
+                self.grid.get_item_rect(i),
+                button_data,
+                self.ui_theme,
+                self.font_manager,
             )
             self.tower_buttons.append(button)
 
@@ -206,15 +211,12 @@ class WorkshopScreen:
         self.filter_buttons.clear()
         all_tower_configs = self.progression_manager.all_tower_configs
         all_unlockable_towers = self.progression_manager.get_unlockable_towers()
-        all_categories = sorted(
-            list(
-                set(
-                    all_tower_configs.get(t["id"], {}).get("category", "N/A")
-                    for t in all_unlockable_towers
-                )
-            )
-        )
-        categories = ["All"] + [cat for cat in all_categories if cat != "N/A"]
+        all_categories = {
+            all_tower_configs.get(t["id"], {}).get("category", "N/A")
+            for t in all_unlockable_towers
+        }
+        all_categories.discard("N/A")
+        categories = ["All", *sorted(all_categories)]
 
         btn_width, btn_height, btn_spacing = (
             120,
@@ -245,33 +247,52 @@ class WorkshopScreen:
         self.preview_panel.set_item(None, "", lambda: None)
         self._build_layout()
 
+    def reset(self):
+        """
+        Returns the screen to its freshly opened state so it can be shown
+        again without being rebuilt.
+        """
+        self.selected_tower_button = None
+        self.preview_panel.set_item(None, "", lambda: None)
+        self.back_button.is_hovered = False
+        self.grid.scroll_y = 0
+        if self.active_filter != "All":
+            # A different filter means a different tower list and filter row.
+            self.active_filter = "All"
+            self._build_layout()
+            return
+        self._hovered_index = None
+        for button in self.tower_buttons:
+            button.is_selected = False
+            button.is_hovered = False
+        for btn in self.filter_buttons:
+            btn.is_hovered = False
+
     def _purchase_tower(self, tower_id: str):
         if self.progression_manager.purchase_tower(tower_id):
             self.set_filter(self.active_filter)
 
     def handle_event(self, event: pygame.event.Event):
         """Handles user input for the workshop screen."""
-        mouse_pos = pygame.mouse.get_pos()
+        # Mouse events carry their position; only others need to query SDL.
+        mouse_pos = getattr(event, "pos", None) or pygame.mouse.get_pos()
 
         # Update hover states for all interactive elements
         self.back_button.is_hovered = self.back_button.rect.collidepoint(mouse_pos)
         for btn in self.filter_buttons:
             btn.is_hovered = btn.rect.collidepoint(mouse_pos)
 
-        hovered_button_index: Optional[int] = None
-        for i, button in enumerate(self.tower_buttons):
-            layout_rect = self.grid.get_item_rect(i)
-            on_screen_rect = layout_rect.move(0, -self.grid.scroll_y)
-            button.rect = on_screen_rect
-
-            # --- FIX: Use colliderect instead of contains for more lenient hover/click detection ---
-            if self.grid.area.colliderect(
-                on_screen_rect
-            ) and on_screen_rect.collidepoint(mouse_pos):
-                button.is_hovered = True
-                hovered_button_index = i
-            else:
-                button.is_hovered = False
+        # Only the visible item under the cursor can be hovered, and the grid
+        # finds it directly instead of testing every tower button.
+        hovered_button_index = self.grid.get_index_at(
+            mouse_pos, len(self.tower_buttons)
+        )
+        if hovered_button_index != self._hovered_index:
+            if self._hovered_index is not None:
+                self.tower_buttons[self._hovered_index].is_hovered = False
+            if hovered_button_index is not None:
+                self.tower_buttons[hovered_button_index].is_hovered = True
+            self._hovered_index = hovered_button_index
 
         self.grid.handle_scroll_event(event)
         self.preview_panel.handle_event(event)
@@ -346,12 +367,12 @@ class WorkshopScreen:
             btn.draw(screen)
 
         screen.set_clip(self.grid.area)
-        for i, button in enumerate(self.tower_buttons):
-            layout_rect = self.grid.get_item_rect(i)
-            button.rect.topleft = (layout_rect.x, layout_rect.y - self.grid.scroll_y)
-            # --- FIX: Only draw buttons that are at least partially visible ---
-            if self.grid.area.colliderect(button.rect):
-                button.draw(screen)
+        visible = []
+        for i, topleft in self.grid.iter_visible(len(self.tower_buttons)):
+            button = self.tower_buttons[i]
+            button.rect.topleft = topleft
+            visible.append(button.render())
+        screen.blits(visible, doreturn=False)
         screen.set_clip(None)
 
         self.grid.draw_scrollbar(screen)
@@ -1,7 +1,7 @@
 # rendering/font/font_manager.py
 import pygame
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -25,6 +25,9 @@ class FontManager:
                                           ui_theme.json configuration file.
         """
         self._font_cache: Dict[str, pygame.font.Font] = {}
+        # Fallback fonts handed out for unknown names, keyed by (name, size),
+        # so a missing definition doesn't build a new Font on every lookup.
+        self._fallback_cache: Dict[Tuple[str, int], pygame.font.Font] = {}
         self._config = font_config
         # --- NEW: Define path to the font file ---
         # We assume the font file is located in 'assets/fonts/'.
@@ -91,8 +94,13 @@ class FontManager:
         font = self._font_cache.get(name)
         if font:
             return font
-        else:
+
+        key = (name, default_size)
+        font = self._fallback_cache.get(key)
+        if font is None:
             logger.warning(
                 f"Font '{name}' not found in cache. Returning default fallback font."
             )
-            return pygame.font.Font(None, default_size)
+            font = pygame.font.Font(None, default_size)
+            self._fallback_cache[key] = font
+        return font